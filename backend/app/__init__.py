@@ -1,17 +1,44 @@
+import orjson
 from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
-from flasgger import Swagger
 from app.config import Config
-from app.database import init_db
+from app.database import init_db, close_db
 
 jwt = JWTManager()
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, used by jsonify and request.get_json"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """jsonify() straight to bytes, skipping the str round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option),
+            mimetype=self.mimetype
+        )
+
+
 def create_app():
     """Application factory pattern"""
     app = Flask(__name__)
     app.config.from_object(Config)
+    app.json = OrjsonProvider(app)
     
     # Initialize extensions
     CORS(app)
@@ -39,7 +66,61 @@ def create_app():
             'message': 'Token has expired'
         }), 401
     
+    @app.errorhandler(413)
+    def request_too_large(error):
+        return jsonify({
+            'error': 'Payload Too Large',
+            'message': 'Request body is too large'
+        }), 413
+    
     # Initialize Swagger - generates docs from actual implementation
+    if app.config['ENABLE_SWAGGER']:
+        init_swagger(app)
+    
+    # Initialize database
+    init_db(app)
+    app.teardown_appcontext(close_db)
+    
+    # Register blueprints
+    from app.routes.auth import auth_bp
+    from app.routes.content import content_bp
+    from app.routes.user_profile import user_profile_bp
+    from app.routes.aura import aura_bp
+    from app.routes.search import search_bp
+    for blueprint, url_prefix in (
+        (auth_bp, '/api/v1/auth'),
+        (content_bp, '/api/v1/content'),
+        (user_profile_bp, '/api/v1/users'),
+        (aura_bp, '/api/v1/aura'),
+        (search_bp, '/api/v1/search'),
+    ):
+        app.register_blueprint(blueprint, url_prefix=url_prefix)
+    
+    return app
+
+
+def init_swagger(app):
+    """Serve live API docs generated from the route docstrings"""
+    # Imported here so workers with docs disabled never load flasgger
+    from flasgger import Swagger
+    
+    class CachedSwagger(Swagger):
+        """Swagger that builds each spec once per process"""
+        
+        def get_apispecs(self, endpoint='apispec_1'):
+            # Flasgger re-parses every docstring per request in debug mode.
+            # Docstrings only change on restart (the reloader restarts the
+            # process), so the first build can always be reused.
+            if endpoint in self.apispecs:
+                return self.apispecs[endpoint]
+            return super().get_apispecs(endpoint)
+        
+        def add_headers(self, app):
+            # Skip the after_request hook on every API response when
+            # there are no extra headers to inject
+            if self.config.get('headers'):
+                super().add_headers(app)
+    
     swagger_config = {
         "headers": [],
         "specs": [
@@ -78,21 +159,4 @@ def create_app():
         }
     }
     
-    Swagger(app, config=swagger_config, template=swagger_template)
-    
-    # Initialize database
-    init_db(app)
-    
-    # Register blueprints
-    from app.routes.auth import auth_bp
-    from app.routes.content import content_bp
-    from app.routes.user_profile import user_profile_bp
-    from app.routes.aura import aura_bp
-    from app.routes.search import search_bp
-    app.register_blueprint(auth_bp, url_prefix='/api/v1/auth')
-    app.register_blueprint(content_bp, url_prefix='/api/v1/content')
-    app.register_blueprint(user_profile_bp, url_prefix='/api/v1/users')
-    app.register_blueprint(aura_bp, url_prefix='/api/v1/aura')
-    app.register_blueprint(search_bp, url_prefix='/api/v1/search')
-    
-    return app
+    CachedSwagger(app, config=swagger_config, template=swagger_template)
@@ -7,11 +7,31 @@ class Config:
     # Database
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'postgresql://localhost:5432/vibecheck')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '20'))
+    SQLALCHEMY_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+    SQLALCHEMY_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))  # seconds
+    SQLALCHEMY_QUERY_CACHE_SIZE = int(os.getenv('DB_QUERY_CACHE_SIZE', '1200'))  # compiled statements
     
     # JWT
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'dev-secret-key-change-in-production')
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(days=7)
     
+    # Run the full email_validator rules on registration, not just the regex
+    STRICT_EMAIL_VALIDATION = os.getenv('STRICT_EMAIL_VALIDATION', '0').lower() in ('1', 'true', 'yes')
+    
+    # Skip bcrypt for logins repeated within 60s (in-process cache, off by default)
+    USE_VERIFY_PASSWORD_CACHE = os.getenv('USE_VERIFY_PASSWORD_CACHE', '0').lower() in ('1', 'true', 'yes')
+    
     # Flask
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-change-in-production')
     DEBUG = os.getenv('FLASK_ENV', 'development') == 'development'
+    # Optional cap on every request body (bytes); larger ones get a 413
+    # before they are read. Unset by default: endpoints size-check their own
+    # bodies, so large but valid avatars aren't refused globally.
+    MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH')) if os.getenv('MAX_CONTENT_LENGTH') else None
+    
+    # Swagger UI at /docs (on by default in development)
+    ENABLE_SWAGGER = os.getenv('ENABLE_SWAGGER', str(DEBUG)).lower() in ('1', 'true', 'yes')
+    
+    # Log every SQL statement (expensive, for debugging only)
+    SQL_LOG = os.getenv('SQL_LOG', '0').lower() in ('1', 'true', 'yes')
@@ -1,21 +1,42 @@
+import logging
 from sqlalchemy import create_engine
 from sqlalchemy.orm import scoped_session, sessionmaker, declarative_base
-from flask import current_app, g
+from flask import g
 
 Base = declarative_base()
 engine = None
-session_factory = None
+# Objects stay loaded after commit, so handlers can serialize what they
+# just wrote without a reload SELECT
+session_factory = sessionmaker(expire_on_commit=False)
+
+
+def _app_ctx_id():
+    """Scope sessions to the current Flask application context"""
+    return id(g._get_current_object())
+
+
+# Built once; each app context gets its own session from the registry
+Session = scoped_session(session_factory, scopefunc=_app_ctx_id)
 
 
 def init_db(app):
     """Initialize database connection"""
-    global engine, session_factory
+    global engine
     
     engine = create_engine(
         app.config['SQLALCHEMY_DATABASE_URI'],
-        echo=app.config['DEBUG']
+        pool_size=app.config['SQLALCHEMY_POOL_SIZE'],
+        max_overflow=app.config['SQLALCHEMY_MAX_OVERFLOW'],
+        pool_recycle=app.config['SQLALCHEMY_POOL_RECYCLE'],
+        query_cache_size=app.config['SQLALCHEMY_QUERY_CACHE_SIZE'],
+        # Check connections on checkout so stale ones are replaced
+        # instead of failing the request
+        pool_pre_ping=True
     )
-    session_factory = sessionmaker(bind=engine)
+    session_factory.configure(bind=engine)
+    
+    if app.config['SQL_LOG']:
+        logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO)
     
     # Import all models to ensure they're registered
     from app.models import user, content, share
@@ -26,15 +47,16 @@ def init_db(app):
 
 def get_db():
     """Get database session for current request context"""
-    if 'db' not in g:
-        if session_factory is None:
+    db = g.get('_db')
+    if db is None:
+        if engine is None:
             raise RuntimeError("Database not initialized. Call init_db first.")
-        g.db = scoped_session(session_factory)
-    return g.db
+        # The session itself rather than the scoped_session proxy, which
+        # would look up the registry again on every attribute access
+        db = g._db = Session()
+    return db
 
 
 def close_db(e=None):
     """Close database session"""
-    db = g.pop('db', None)
-    if db is not None:
-        db.remove()
+    Session.remove()
@@ -1,9 +1,25 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, Text, Enum, DateTime
+from sqlalchemy import Column, String, Integer, Float, Text, Enum, DateTime, Index, DDL, event
 import enum
 from app.database import Base
 
 
+# Global search matches columns with ILIKE '%query%', which a btree index
+# can't serve; trigram GIN indexes can
+event.listen(
+    Base.metadata, 'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql')
+)
+
+
+def trigram_index(table_name, column_name):
+    """GIN trigram index on a column, for substring (I)LIKE searches"""
+    return Index(
+        f'ix_{table_name}_{column_name}_trgm', column_name,
+        postgresql_using='gin', postgresql_ops={column_name: 'gin_trgm_ops'}
+    )
+
+
 class MovieType(str, enum.Enum):
     """Movie type enumeration"""
     MOVIE = "movie"
@@ -33,6 +49,8 @@ class Movie(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (trigram_index('movies', 'title'), trigram_index('movies', 'director'))
+    
     def to_dict(self):
         """Convert movie to dictionary matching OpenAPI schema"""
         result = {
@@ -68,6 +86,8 @@ class Album(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (trigram_index('albums', 'title'), trigram_index('albums', 'artist'))
+    
     def to_dict(self):
         """Convert album to dictionary matching OpenAPI schema"""
         result = {
@@ -99,6 +119,8 @@ class Game(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (trigram_index('games', 'title'),)
+    
     def to_dict(self):
         """Convert game to dictionary matching OpenAPI schema"""
         result = {
@@ -130,6 +152,8 @@ class Book(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (trigram_index('books', 'title'), trigram_index('books', 'author'))
+    
     def to_dict(self):
         """Convert book to dictionary matching OpenAPI schema"""
         result = {
@@ -164,6 +188,12 @@ class Location(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (
+        trigram_index('locations', 'name'),
+        trigram_index('locations', 'city'),
+        trigram_index('locations', 'country'),
+    )
+    
     def to_dict(self):
         """Convert location to dictionary matching OpenAPI schema"""
         result = {
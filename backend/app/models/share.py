@@ -1,7 +1,8 @@
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
-import uuid
+import secrets
 from app.database import Base
 
 
@@ -9,8 +10,8 @@ class Share(Base):
     """User content share model matching the OpenAPI UserShare schema"""
     __tablename__ = 'shares'
     
-    id = Column(String, primary_key=True, default=lambda: f"s_{uuid.uuid4().hex[:12]}")
-    user_id = Column(String, ForeignKey('users.user_id'), nullable=False, index=True)
+    id = Column(String, primary_key=True, default=lambda: f"s_{secrets.token_hex(6)}")
+    user_id = Column(String, ForeignKey('users.user_id'), nullable=False)
     
     # Content reference
     category = Column(String(50), nullable=False, index=True)  # cinema, music, games, books, travel
@@ -22,11 +23,32 @@ class Share(Base):
     dominant_color = Column(String(7), nullable=True)  # Hex color code #RRGGBB
     caption = Column(String(500), nullable=True)  # User's caption/note
     
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    # Per-user lookups are covered by the composite indexes below:
+    # recent shares walk (user_id, created_at DESC, id DESC), the order and
+    # keyset cursor of the shares list, and stop at the LIMIT; category
+    # counts are answered from (user_id, category)
+    __table_args__ = (
+        Index('ix_shares_user_created', 'user_id', created_at.desc(), id.desc()),
+        Index('ix_shares_user_category', 'user_id', 'category'),
+    )
     
     # Relationship to User
     user = relationship('User', backref='shares')
     
+    @hybrid_property
+    def timestamp(self):
+        """Creation time as an ISO 8601 string, always with microseconds"""
+        # isoformat() would drop a zero microsecond part; pinning it keeps
+        # this identical to the SQL expression below
+        return self.created_at.isoformat(timespec='microseconds')
+    
+    @timestamp.expression
+    def timestamp(cls):
+        # Formatted by Postgres so list queries skip per-row isoformat()
+        return func.to_char(cls.created_at, 'YYYY-MM-DD"T"HH24:MI:SS.US')
+    
     def to_dict(self):
         """Convert share to dictionary"""
         return {
@@ -38,7 +60,7 @@ class Share(Base):
             'image': self.image,
             'dominantColor': self.dominant_color,
             'caption': self.caption,
-            'timestamp': self.created_at.isoformat()
+            'timestamp': self.timestamp
         }
     
     def __repr__(self):
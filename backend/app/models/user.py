@@ -1,16 +1,60 @@
+import os
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text
-from sqlalchemy.dialects.postgresql import UUID, JSON
-import uuid
+from operator import attrgetter
+from sqlalchemy import Column, String, DateTime, Text, CheckConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+import secrets
 import bcrypt
+import orjson
 from app.database import Base
 
+# bcrypt work factor; lower it (e.g. BCRYPT_COST=4) for tests and CI only
+_BCRYPT_COST = int(os.getenv('BCRYPT_COST', '12'))
+
+
+# Public user fields, as (JSON key, attribute) pairs in response order
+_PUBLIC_FIELDS = (
+    ('userId', 'user_id'),
+    ('email', 'email'),
+    ('username', 'username'),
+    ('avatar', 'avatar'),
+    ('bio', 'bio'),
+    ('createdAt', 'created_at'),
+    ('updatedAt', 'updated_at'),
+)
+_PUBLIC_KEYS = tuple(key for key, _ in _PUBLIC_FIELDS)
+# Reads every public attribute in one C-level call
+_public_values = attrgetter(*(attribute for _, attribute in _PUBLIC_FIELDS))
+
+
+def hash_password(password):
+    """Hash a password with the configured bcrypt cost"""
+    return bcrypt.hashpw(
+        password.encode('utf-8'),
+        bcrypt.gensalt(rounds=_BCRYPT_COST)
+    ).decode('utf-8')
+
+
+def password_needs_rehash(password_hash):
+    """True if a bcrypt hash ($2b$<cost>$...) was made with another cost"""
+    try:
+        return int(password_hash.split('$')[2]) != _BCRYPT_COST
+    except (IndexError, ValueError):
+        return False
+
+
+def verify_password_hash(password, password_hash):
+    """Verify password (str or pre-encoded UTF-8 bytes) against a stored hash"""
+    if isinstance(password, str):
+        password = password.encode('utf-8')
+    return bcrypt.checkpw(password, password_hash.encode('utf-8'))
+
 
 class User(Base):
     """User model matching the OpenAPI User schema"""
     __tablename__ = 'users'
     
-    user_id = Column(String, primary_key=True, default=lambda: f"u_{uuid.uuid4().hex[:12]}")
+    user_id = Column(String, primary_key=True, default=lambda: f"u_{secrets.token_hex(6)}")
     email = Column(String(255), unique=True, nullable=False, index=True)
     username = Column(String(20), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
@@ -18,25 +62,26 @@ class User(Base):
     bio = Column(String(500), nullable=True)
     
     # Aura profile fields
-    aura_colors = Column(JSON, nullable=True)  # Array of hex color codes
-    aesthetic_tags = Column(JSON, nullable=True)  # Array of aesthetic style tags
+    # JSONB is stored pre-parsed, so reads skip re-parsing the text
+    aura_colors = Column(JSONB, nullable=True)  # Array of hex color codes
+    aesthetic_tags = Column(JSONB, nullable=True)  # Array of aesthetic style tags
     
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (
+        # String(20) / String(500) already cap username and bio in the
+        # database; this adds registration's lower bound
+        CheckConstraint('length(username) >= 3', name='ck_users_username_min_length'),
+    )
+    
     def set_password(self, password):
         """Hash and set password"""
-        self.password_hash = bcrypt.hashpw(
-            password.encode('utf-8'), 
-            bcrypt.gensalt()
-        ).decode('utf-8')
+        self.password_hash = hash_password(password)
     
     def check_password(self, password):
-        """Verify password against hash"""
-        return bcrypt.checkpw(
-            password.encode('utf-8'), 
-            self.password_hash.encode('utf-8')
-        )
+        """Verify password (str or pre-encoded UTF-8 bytes) against hash"""
+        return verify_password_hash(password, self.password_hash)
     
     def to_dict(self):
         """Convert user to dictionary (exclude password)"""
@@ -50,5 +95,11 @@ class User(Base):
             'updatedAt': self.updated_at.isoformat()
         }
     
+    def to_json(self):
+        """to_dict() serialized to JSON bytes, for splicing into responses"""
+        # orjson writes naive datetimes exactly like isoformat(), without
+        # building the intermediate strings in Python
+        return orjson.dumps(dict(zip(_PUBLIC_KEYS, _public_values(self))))
+    
     def __repr__(self):
         return f'<User {self.username}>'
@@ -1,13 +1,159 @@
-from flask import Blueprint, request, jsonify
+import hashlib
+import re
+from datetime import datetime
+from flask import Blueprint, request, jsonify, g, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import func
+from sqlalchemy import text, bindparam, insert, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
 from app.database import get_db
 from app.models.user import User
 from app.models.share import Share
-from typing import cast
 
 aura_bp = Blueprint('aura', __name__)
 
+_HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
+_VALID_CATEGORIES = frozenset(('cinema', 'music', 'games', 'books', 'travel'))
+_VALID_CATEGORIES_STR = 'cinema, music, games, books, travel'
+
+# Share columns labelled with their UserShare schema names, so list
+# queries return rows that serialize without building ORM objects
+_SHARE_FIELDS = (
+    Share.id.label('id'),
+    Share.user_id.label('userId'),
+    Share.category.label('category'),
+    Share.content_id.label('contentId'),
+    Share.title.label('title'),
+    Share.image.label('image'),
+    Share.dominant_color.label('dominantColor'),
+    Share.caption.label('caption'),
+    Share.timestamp.label('timestamp'),
+)
+
+
+# ──────────────────────────────────────────────
+# AURA PROFILE QUERIES
+# ──────────────────────────────────────────────
+
+# Recent shares and category counts are computed from the same CTE so the
+# whole profile comes back from Postgres in a single round-trip. Recent
+# shares are serialized to the UserShare schema by Postgres itself.
+_AURA_SHARES_SQL = """
+    s AS (
+        SELECT id, user_id, category, content_id, title, image,
+               dominant_color, caption, created_at
+        FROM shares
+        WHERE user_id = :user_id
+    )
+"""
+
+_AURA_PROFILE_COLUMNS_SQL = """
+    u.user_id, u.username, u.avatar, u.bio, u.aura_colors, u.aesthetic_tags,
+    (SELECT json_agg(json_build_object(
+                'id', r.id,
+                'userId', r.user_id,
+                'category', r.category,
+                'contentId', r.content_id,
+                'title', r.title,
+                'image', r.image,
+                'dominantColor', r.dominant_color,
+                'caption', r.caption,
+                'timestamp', to_char(r.created_at, 'YYYY-MM-DD"T"HH24:MI:SS.US')
+            ) ORDER BY r.created_at DESC)
+     FROM (SELECT * FROM s ORDER BY created_at DESC LIMIT 10) r) AS recent_shares,
+    (SELECT json_agg(c)
+     FROM (SELECT category, count(*) AS count FROM s GROUP BY category) c) AS category_counts
+"""
+
+_AURA_PROFILE_SQL = text(f"""
+    WITH {_AURA_SHARES_SQL}
+    SELECT {_AURA_PROFILE_COLUMNS_SQL}
+    FROM users u
+    WHERE u.user_id = :user_id
+""")
+
+# Same as above, but the UPDATE runs in the same statement and the profile
+# is built from its RETURNING row. NULL parameters leave the column untouched.
+_AURA_PROFILE_UPDATE_SQL = text(f"""
+    WITH u AS (
+        UPDATE users
+        SET aesthetic_tags = COALESCE(:aesthetic_tags, aesthetic_tags),
+            aura_colors = COALESCE(:aura_colors, aura_colors),
+            updated_at = (now() AT TIME ZONE 'utc')
+        WHERE user_id = :user_id
+        RETURNING user_id, username, avatar, bio, aura_colors, aesthetic_tags
+    ),
+    {_AURA_SHARES_SQL}
+    SELECT {_AURA_PROFILE_COLUMNS_SQL}
+    FROM u
+""").bindparams(
+    bindparam('aesthetic_tags', type_=JSONB(none_as_null=True)),
+    bindparam('aura_colors', type_=JSONB(none_as_null=True)),
+)
+
+# Everything the public aura profile depends on, used to build its ETag
+_AURA_VERSION_SQL = text("""
+    SELECT u.updated_at,
+           (SELECT max(created_at) FROM shares WHERE user_id = :user_id) AS last_share_at
+    FROM users u
+    WHERE u.user_id = :user_id
+""")
+
+
+def _current_uid():
+    """JWT identity of the current request, decoded once and kept on g"""
+    uid = g.get('_uid')
+    if uid is None:
+        uid = get_jwt_identity()
+        g._uid = uid
+    return uid
+
+
+def _build_aura_profile(db, user_id, aesthetic_tags=None, aura_colors=None):
+    """
+    Build the aura profile for a user in a single database round-trip.
+
+    When aesthetic_tags or aura_colors are given, the user row is updated
+    in the same statement before the profile is read back.
+    Returns None if the user does not exist.
+    """
+    if aesthetic_tags is None and aura_colors is None:
+        row = db.execute(_AURA_PROFILE_SQL, {'user_id': user_id}).mappings().first()
+    else:
+        row = db.execute(_AURA_PROFILE_UPDATE_SQL, {
+            'user_id': user_id,
+            'aesthetic_tags': aesthetic_tags,
+            'aura_colors': aura_colors
+        }).mappings().first()
+    
+    if row is None:
+        return None
+    
+    category_counts = row['category_counts'] or []
+    total_shares = sum(c['count'] for c in category_counts)
+    top_categories = []
+    
+    if total_shares > 0:
+        for cat in category_counts:
+            percentage = round((cat['count'] / total_shares) * 100, 1)
+            top_categories.append({
+                'category': cat['category'],
+                'percentage': percentage
+            })
+        # Sort by percentage descending
+        top_categories.sort(key=lambda x: x['percentage'], reverse=True)
+    
+    return {
+        'userId': row['user_id'],
+        'username': row['username'],
+        'avatar': row['avatar'],
+        'bio': row['bio'],
+        'recentShares': row['recent_shares'] or [],
+        'auraColors': row['aura_colors'] or [],
+        'aestheticTags': row['aesthetic_tags'] or [],
+        'topCategories': top_categories
+    }
+
 
 # ──────────────────────────────────────────────
 # AURA PROFILE ENDPOINTS
@@ -49,54 +195,17 @@ def get_current_user_aura():
         description: Unauthorized
     """
     try:
-        current_user_id = get_jwt_identity()
+        current_user_id = _current_uid()
         db = get_db()
         
-        # Get user
-        user = db.query(User).filter_by(user_id=current_user_id).first()
+        aura_profile = _build_aura_profile(db, current_user_id)
         
-        if not user:
+        if aura_profile is None:
             return jsonify({
                 'error': 'Not Found',
                 'message': 'User not found'
             }), 404
         
-        # Get recent shares (limit 10)
-        recent_shares = db.query(Share).filter_by(
-            user_id=current_user_id
-        ).order_by(Share.created_at.desc()).limit(10).all()
-        
-        # Calculate category distribution
-        category_counts = db.query(
-            Share.category,
-            func.count(Share.id).label('count')
-        ).filter_by(user_id=current_user_id).group_by(Share.category).all()
-        
-        total_shares: int = sum([cast(int, c.count) for c in category_counts], 0)
-        top_categories = []
-        
-        if total_shares > 0:
-            for cat in category_counts:
-                percentage = round((cast(int, cat.count) / total_shares) * 100, 1)
-                top_categories.append({
-                    'category': cat.category,
-                    'percentage': percentage
-                })
-            # Sort by percentage descending
-            top_categories.sort(key=lambda x: x['percentage'], reverse=True)
-        
-        # Build aura profile response
-        aura_profile = {
-            'userId': user.user_id,
-            'username': user.username,
-            'avatar': user.avatar,
-            'bio': user.bio,
-            'recentShares': [share.to_dict() for share in recent_shares],
-            'auraColors': user.aura_colors or [],
-            'aestheticTags': user.aesthetic_tags or [],
-            'topCategories': top_categories
-        }
-        
         return jsonify(aura_profile), 200
     
     except Exception as e:
@@ -143,7 +252,7 @@ def update_aura_profile():
     """
     db = None
     try:
-        current_user_id = get_jwt_identity()
+        current_user_id = _current_uid()
         data = request.get_json()
         
         if not data:
@@ -152,27 +261,19 @@ def update_aura_profile():
                 'message': 'Request body is required'
             }), 400
         
-        db = get_db()
-        
-        # Get user
-        user = db.query(User).filter_by(user_id=current_user_id).first()
-        
-        if not user:
-            return jsonify({
-                'error': 'Not Found',
-                'message': 'User not found'
-            }), 404
+        aesthetic_tags = None
+        aura_colors = None
         
-        # Update aesthetic tags
+        # Validate aesthetic tags
         if 'aestheticTags' in data:
             if not isinstance(data['aestheticTags'], list):
                 return jsonify({
                     'error': 'Bad Request',
                     'message': 'aestheticTags must be an array'
                 }), 400
-            user.aesthetic_tags = data['aestheticTags']
+            aesthetic_tags = data['aestheticTags']
         
-        # Update aura colors
+        # Validate aura colors
         if 'auraColors' in data:
             if not isinstance(data['auraColors'], list):
                 return jsonify({
@@ -180,54 +281,38 @@ def update_aura_profile():
                     'message': 'auraColors must be an array'
                 }), 400
             
-            # Validate hex color format
-            import re
-            hex_pattern = re.compile(r'^#[0-9A-Fa-f]{6}$')
-            for color in data['auraColors']:
-                if not hex_pattern.match(color):
-                    return jsonify({
-                        'error': 'Bad Request',
-                        'message': f'Invalid color format: {color}. Must be #RRGGBB'
-                    }), 400
+            # Validate hex color format; only look for the offending
+            # color once the fast check has failed
+            if not all(map(_HEX_COLOR_RE.match, data['auraColors'])):
+                color = next(c for c in data['auraColors'] if not _HEX_COLOR_RE.match(c))
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': f'Invalid color format: {color}. Must be #RRGGBB'
+                }), 400
             
-            user.aura_colors = data['auraColors']
+            aura_colors = data['auraColors']
         
-        db.commit()
+        db = get_db()
         
-        # Return full aura profile
-        # Get recent shares
-        recent_shares = db.query(Share).filter_by(
-            user_id=current_user_id
-        ).order_by(Share.created_at.desc()).limit(10).all()
-        
-        # Calculate category distribution
-        category_counts = db.query(
-            Share.category,
-            func.count(Share.id).label('count')
-        ).filter_by(user_id=current_user_id).group_by(Share.category).all()
-        
-        total_shares: int = sum([cast(int, c.count) for c in category_counts], 0)
-        top_categories = []
-        
-        if total_shares > 0:
-            for cat in category_counts:
-                percentage = round((cast(int, cat.count) / total_shares) * 100, 1)
-                top_categories.append({
-                    'category': cat.category,
-                    'percentage': percentage
-                })
-            top_categories.sort(key=lambda x: x['percentage'], reverse=True)
-        
-        aura_profile = {
-            'userId': user.user_id,
-            'username': user.username,
-            'avatar': user.avatar,
-            'bio': user.bio,
-            'recentShares': [share.to_dict() for share in recent_shares],
-            'auraColors': user.aura_colors or [],
-            'aestheticTags': user.aesthetic_tags or [],
-            'topCategories': top_categories
-        }
+        # Update and return full aura profile. Recent shares and categories
+        # are unaffected by these fields, so they are read in the same
+        # statement; with nothing to update it is a plain read.
+        aura_profile = _build_aura_profile(
+            db, current_user_id,
+            aesthetic_tags=aesthetic_tags,
+            aura_colors=aura_colors
+        )
+        
+        if aura_profile is None:
+            db.rollback()
+            return jsonify({
+                'error': 'Not Found',
+                'message': 'User not found'
+            }), 404
+        
+        # Skip the COMMIT round-trip when no UPDATE was issued
+        if aesthetic_tags is not None or aura_colors is not None:
+            db.commit()
         
         return jsonify(aura_profile), 200
     
@@ -256,57 +341,46 @@ def get_user_aura(user_id):
     responses:
       200:
         description: Aura profile retrieved
+      304:
+        description: Not modified since the ETag in If-None-Match
       404:
         description: User not found
     """
     try:
         db = get_db()
         
-        # Get user
-        user = db.query(User).filter_by(user_id=user_id).first()
+        # Cheap version probe: the profile only changes when the user row
+        # is updated or a new share is posted
+        version = db.execute(_AURA_VERSION_SQL, {'user_id': user_id}).first()
         
-        if not user:
+        if version is None:
             return jsonify({
                 'error': 'Not Found',
                 'message': 'User not found'
             }), 404
         
-        # Get recent shares
-        recent_shares = db.query(Share).filter_by(
-            user_id=user_id
-        ).order_by(Share.created_at.desc()).limit(10).all()
-        
-        # Calculate category distribution
-        category_counts = db.query(
-            Share.category,
-            func.count(Share.id).label('count')
-        ).filter_by(user_id=user_id).group_by(Share.category).all()
-        
-        total_shares: int = sum([cast(int, c.count) for c in category_counts], 0)
-        top_categories = []
-        
-        if total_shares > 0:
-            for cat in category_counts:
-                percentage = round((cast(int, cat.count) / total_shares) * 100, 1)
-                top_categories.append({
-                    'category': cat.category,
-                    'percentage': percentage
-                })
-            top_categories.sort(key=lambda x: x['percentage'], reverse=True)
-        
-        # Build aura profile response
-        aura_profile = {
-            'userId': user.user_id,
-            'username': user.username,
-            'avatar': user.avatar,
-            'bio': user.bio,
-            'recentShares': [share.to_dict() for share in recent_shares],
-            'auraColors': user.aura_colors or [],
-            'aestheticTags': user.aesthetic_tags or [],
-            'topCategories': top_categories
-        }
+        etag = hashlib.md5(
+            f"{user_id}:{version.updated_at}:{version.last_share_at}".encode('utf-8'),
+            usedforsecurity=False
+        ).hexdigest()
         
-        return jsonify(aura_profile), 200
+        if request.if_none_match.contains(etag):
+            response = current_app.response_class(status=304)
+        else:
+            aura_profile = _build_aura_profile(db, user_id)
+            
+            if aura_profile is None:
+                return jsonify({
+                    'error': 'Not Found',
+                    'message': 'User not found'
+                }), 404
+            
+            response = jsonify(aura_profile)
+        
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = 30
+        return response
     
     except Exception as e:
         return jsonify({
@@ -339,7 +413,11 @@ def get_user_shares():
         in: query
         type: integer
         default: 0
-        description: Pagination offset
+        description: Pagination offset (deprecated, use cursor)
+      - name: cursor
+        in: query
+        type: string
+        description: Opaque nextCursor from the previous page
     responses:
       200:
         description: User shares list
@@ -352,18 +430,23 @@ def get_user_shares():
               type: integer
             offset:
               type: integer
+              description: Omitted when paging with a cursor
             data:
               type: array
+            nextCursor:
+              type: string
+              description: Cursor for the next page, null on the last page
       401:
         description: Unauthorized
     """
     try:
-        current_user_id = get_jwt_identity()
+        current_user_id = _current_uid()
         db = get_db()
         
         # Pagination parameters
         limit = request.args.get('limit', 20, type=int)
         offset = request.args.get('offset', 0, type=int)
+        cursor = request.args.get('cursor')
         
         # Validate pagination
         if limit < 1 or limit > 100:
@@ -375,16 +458,40 @@ def get_user_shares():
         query = db.query(Share).filter_by(user_id=current_user_id)
         total = query.count()
         
-        shares = query.order_by(
-            Share.created_at.desc()
-        ).limit(limit).offset(offset).all()
+        page = query.with_entities(*_SHARE_FIELDS)
+        if cursor:
+            # Keyset pagination: a bounded range scan on
+            # (user_id, created_at DESC, id DESC) no matter how deep the page
+            # is. The cursor is the last row's "timestamp|id"; the id breaks
+            # ties between shares created in the same instant.
+            cursor_time, _, cursor_id = cursor.partition('|')
+            try:
+                cursor_dt = datetime.fromisoformat(cursor_time)
+            except ValueError:
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': 'cursor must be a nextCursor from a previous page'
+                }), 400
+            page = page.filter(
+                tuple_(Share.created_at, Share.id) < tuple_(cursor_dt, cursor_id)
+            )
+        elif offset:
+            # Deprecated: the database still scans and discards offset rows
+            page = page.offset(offset)
         
-        return jsonify({
+        shares = page.order_by(Share.created_at.desc(), Share.id.desc()).limit(limit).all()
+        
+        result = {
             'total': total,
             'limit': limit,
-            'offset': offset,
-            'data': [share.to_dict() for share in shares]
-        }), 200
+            'data': [dict(share._mapping) for share in shares],
+            'nextCursor': (
+                f"{shares[-1].timestamp}|{shares[-1].id}" if len(shares) == limit else None
+            )
+        }
+        if not cursor:
+            result['offset'] = offset
+        return jsonify(result), 200
     
     except Exception as e:
         return jsonify({
@@ -434,7 +541,7 @@ def create_share():
     """
     db = None
     try:
-        current_user_id = get_jwt_identity()
+        current_user_id = _current_uid()
         data = request.get_json()
         
         if not data:
@@ -457,11 +564,10 @@ def create_share():
             }), 400
         
         # Validate category
-        valid_categories = ['cinema', 'music', 'games', 'books', 'travel']
-        if data['category'] not in valid_categories:
+        if not isinstance(data['category'], str) or data['category'] not in _VALID_CATEGORIES:
             return jsonify({
                 'error': 'Bad Request',
-                'message': f"Invalid category. Must be one of: {', '.join(valid_categories)}"
+                'message': f"Invalid category. Must be one of: {_VALID_CATEGORIES_STR}"
             }), 400
         
         # Validate caption length if provided
@@ -474,8 +580,8 @@ def create_share():
         
         db = get_db()
         
-        # Verify user exists
-        user = db.query(User).filter_by(user_id=current_user_id).first()
+        # Verify user exists (only the key column is needed)
+        user = db.query(User.user_id).filter_by(user_id=current_user_id).first()
         if not user:
             return jsonify({
                 'error': 'Unauthorized',
@@ -484,24 +590,27 @@ def create_share():
         
         # For now, we'll use the contentId as the title
         # In a real implementation, you'd fetch the actual title from the external API
-        title = data.get('title', f"{data['category'].title()} - {data['contentId']}")
-        
-        # Create new share
-        new_share = Share(
-            user_id=current_user_id,
-            category=data['category'],
-            content_id=data['contentId'],
-            title=title,
-            image=data.get('image'),
-            dominant_color=data.get('dominantColor'),
-            caption=caption
-        )
-        
-        db.add(new_share)
+        if 'title' in data:
+            title = data['title']
+        else:
+            title = f"{data['category'].title()} - {data['contentId']}"
+        
+        # Create new share; RETURNING hands back the generated id and
+        # timestamp so no follow-up SELECT is needed
+        new_share = db.execute(
+            insert(Share).values(
+                user_id=current_user_id,
+                category=data['category'],
+                content_id=data['contentId'],
+                title=title,
+                image=data.get('image'),
+                dominant_color=data.get('dominantColor'),
+                caption=caption
+            ).returning(*_SHARE_FIELDS)
+        ).mappings().one()
         db.commit()
-        db.refresh(new_share)
         
-        return jsonify(new_share.to_dict()), 201
+        return jsonify(dict(new_share)), 201
     
     except Exception as e:
         if db is not None:
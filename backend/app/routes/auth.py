@@ -1,13 +1,82 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import create_access_token
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, exists, bindparam, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import load_only
 from email_validator import validate_email, EmailNotValidError
+from cachetools import LRUCache, TTLCache
+import hashlib
+import orjson
 import re
+import secrets
+import threading
+import time
 from app.database import get_db
-from app.models.user import User
+from app.models.user import User, verify_password_hash, hash_password, password_needs_rehash
 
 auth_bp = Blueprint('auth', __name__)
 
+# All password rules in one pattern, so strong passwords need a single match
+_STRONG_PASSWORD_RE = re.compile(r'(?=.*[A-Z])(?=.*[a-z])(?=.*\d).{8,}', re.DOTALL)
+_UPPER_RE = re.compile(r'[A-Z]')
+_LOWER_RE = re.compile(r'[a-z]')
+_DIGIT_RE = re.compile(r'\d')
+
+# Upper bounds checked before any real work (RFC 5321 path limit for email)
+_MAX_EMAIL_LENGTH = 254
+_MAX_PASSWORD_LENGTH = 128
+
+# Fixed error bodies, serialized once at import: slug -> (body, status)
+_ERRORS = {
+    slug: (orjson.dumps({'error': error, 'message': message}) + b'\n', status)
+    for slug, (error, message, status) in {
+        'missing_body': ('Bad Request', 'Request body is required', 400),
+        'login_fields_required': ('Bad Request', 'Email and password are required', 400),
+        'register_fields_required': ('Bad Request', 'Email, password, and username are required', 400),
+        'fields_too_long': ('Bad Request', 'Email or password is too long', 400),
+        'invalid_email': ('Bad Request', 'Invalid email format', 400),
+        'invalid_username_length': ('Bad Request', 'Username must be between 3 and 20 characters', 400),
+        'invalid_credentials': ('Unauthorized', 'Invalid email or password', 401),
+        'email_taken': ('Conflict', 'Email already exists', 409),
+        'username_taken': ('Conflict', 'Username already exists', 409),
+        'internal_error': ('Internal Server Error', 'An unexpected error occurred', 500),
+    }.items()
+}
+
+# Cheap syntactic email check; email_validator only runs in strict mode
+_EMAIL_RE = re.compile(r"[^@\s]{1,64}@[^@\s]{1,253}\.[^@\s]{2,63}")
+
+# Verified against when the email is unknown; same cost as real hashes
+_DUMMY_HASH = hash_password(secrets.token_urlsafe(16))
+
+# Successful bcrypt verifications (opt-in via USE_VERIFY_PASSWORD_CACHE).
+# Keyed by sha256(email:password), never the raw password; the value is the
+# stored hash that was verified, so a changed password misses the cache.
+_VERIFY_CACHE = TTLCache(maxsize=10_000, ttl=60)
+_VERIFY_CACHE_LOCK = threading.Lock()
+
+# Auth statements are built once; SQLAlchemy then reuses their compiled
+# form from its statement cache on every request.
+# Login loads the hash to verify plus what User.to_dict() returns, leaving
+# out the aura JSONB columns.
+_LOGIN_STMT = select(User).options(load_only(
+    User.user_id, User.email, User.username, User.password_hash,
+    User.avatar, User.bio, User.created_at, User.updated_at
+)).where(User.email == bindparam('email'))
+# Unique indexes on users, by name, and the error each violation maps to
+_UNIQUE_CONFLICTS = {
+    'ix_users_email': 'email_taken',
+    'ix_users_username': 'username_taken',
+}
+_TAKEN_STMT = select(
+    exists().where(User.email == bindparam('email')),
+    exists().where(User.username == bindparam('username'))
+)
+
+# Access tokens already minted per user: user_id -> (token, expires_at)
+_JWT_CACHE = LRUCache(maxsize=10_000)
+_JWT_CACHE_LOCK = threading.Lock()
+
 
 def validate_password_strength(password):
     """
@@ -18,17 +87,126 @@ def validate_password_strength(password):
     - Contains at least one lowercase letter
     - Contains at least one digit
     """
+    if _STRONG_PASSWORD_RE.match(password):
+        return True, "Password is strong"
+    
+    # Slow path: find the first failing rule for the error message
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
-    if not re.search(r'[A-Z]', password):
+    if not _UPPER_RE.search(password):
         return False, "Password must contain at least one uppercase letter"
-    if not re.search(r'[a-z]', password):
+    if not _LOWER_RE.search(password):
         return False, "Password must contain at least one lowercase letter"
-    if not re.search(r'\d', password):
+    if not _DIGIT_RE.search(password):
         return False, "Password must contain at least one digit"
     return True, "Password is strong"
 
 
+def _json_body():
+    """Parse the request body with orjson; None unless it is a JSON object"""
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _auth_response(access_token, user_json, status):
+    """Build {token, user} by splicing the pre-serialized user JSON"""
+    body = b''.join((b'{"token":', orjson.dumps(access_token), b',"user":', user_json, b'}\n'))
+    return current_app.response_class(body, status=status, mimetype='application/json')
+
+
+def _error_response(slug):
+    """Return one of the pre-serialized error responses"""
+    body, status = _ERRORS[slug]
+    return current_app.response_class(body, status=status, mimetype='application/json')
+
+
+def is_valid_email(email, strict=False):
+    """Validate email syntax, with the full email_validator rules if strict"""
+    if not isinstance(email, str) or not _EMAIL_RE.fullmatch(email):
+        return False
+    if strict:
+        try:
+            validate_email(email, check_deliverability=False)
+        except EmailNotValidError:
+            return False
+    return True
+
+
+def _register_conflict(db, error, email, username):
+    """
+    Tell which unique index a failed registration INSERT violated.
+    
+    Returns an error slug, or None when the error was not an email or
+    username conflict (e.g. a CHECK constraint).
+    """
+    # psycopg2 reports the violated index or constraint by name
+    constraint = getattr(getattr(error.orig, 'diag', None), 'constraint_name', None)
+    if constraint:
+        return _UNIQUE_CONFLICTS.get(constraint)
+    
+    # Drivers without diagnostics (e.g. SQLite): probe both unique indexes
+    # in one round trip
+    email_taken, username_taken = db.execute(
+        _TAKEN_STMT, {'email': email, 'username': username}
+    ).one()
+    if email_taken:
+        return 'email_taken'
+    if username_taken:
+        return 'username_taken'
+    return None
+
+
+def _verify_password(password_hash, email, password):
+    """Check a login password, reusing recent bcrypt results when enabled"""
+    if not current_app.config.get('USE_VERIFY_PASSWORD_CACHE'):
+        return verify_password_hash(password, password_hash)
+    
+    key = hashlib.sha256(f"{email}:{password}".encode('utf-8')).hexdigest()
+    with _VERIFY_CACHE_LOCK:
+        verified_hash = _VERIFY_CACHE.get(key)
+    if verified_hash is not None and verified_hash == password_hash:
+        return True
+    
+    if not verify_password_hash(password, password_hash):
+        return False
+    with _VERIFY_CACHE_LOCK:
+        _VERIFY_CACHE[key] = password_hash
+    return True
+
+
+def _load_login_user(db, email):
+    """Return (user_id, password_hash, user JSON) for an email, or None"""
+    # Always read from the database: a per-process cache would keep serving
+    # a changed password hash or profile from the other gunicorn workers
+    user = db.execute(_LOGIN_STMT, {'email': email}).scalar_one_or_none()
+    if not user:
+        return None
+    return user.user_id, user.password_hash, user.to_json()
+
+
+def _mint_or_reuse(user_id):
+    """Return the user's cached access token while most of its lifetime remains"""
+    expires = current_app.config['JWT_ACCESS_TOKEN_EXPIRES']
+    if not expires:
+        return create_access_token(identity=user_id)
+    
+    lifetime = expires.total_seconds()
+    now = time.time()
+    with _JWT_CACHE_LOCK:
+        token, expires_at = _JWT_CACHE.get(user_id, (None, 0))
+    # A fresh login should get a token that lasts, not one about to expire
+    if token and expires_at - now > lifetime / 2:
+        return token
+    
+    token = create_access_token(identity=user_id)
+    with _JWT_CACHE_LOCK:
+        _JWT_CACHE[user_id] = (token, now + lifetime)
+    return token
+
+
 @auth_bp.route('/login', methods=['POST'])
 def login():
     """
@@ -112,59 +290,62 @@ def login():
               type: string
               example: Invalid email or password
     """
+    data = _json_body()
+    
+    # Validate required fields
+    if not data:
+        return _error_response('missing_body')
+    
+    email = data.get('email')
+    password = data.get('password')
+    
+    if not isinstance(email, str) or not isinstance(password, str) or not email or not password:
+        return _error_response('login_fields_required')
+    
+    if len(email) > _MAX_EMAIL_LENGTH or len(password) > _MAX_PASSWORD_LENGTH:
+        return _error_response('fields_too_long')
+    
+    # Validate email format
+    if not is_valid_email(email):
+        return _error_response('invalid_email')
+    
+    # Get database session
+    db = get_db()
+    
     try:
-        data = request.get_json()
-        
-        # Validate required fields
-        if not data:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Request body is required'
-            }), 400
-        
-        email = data.get('email')
-        password = data.get('password')
+        # Find user by email
+        login_user = _load_login_user(db, email)
         
-        if not email or not password:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Email and password are required'
-            }), 400
+        if not login_user:
+            # Spend the same bcrypt time as a real check so response timing
+            # does not reveal which emails are registered
+            verify_password_hash(password, _DUMMY_HASH)
+            return _error_response('invalid_credentials')
         
-        # Validate email format
-        try:
-            validate_email(email, check_deliverability=False)
-        except EmailNotValidError:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Invalid email format'
-            }), 400
+        if not _verify_password(login_user[1], email, password):
+            return _error_response('invalid_credentials')
         
-        # Get database session
-        db = get_db()
+        user_id, password_hash, user_json = login_user
         
-        # Find user by email
-        user = db.query(User).filter_by(email=email).first()
-        
-        if not user or not user.check_password(password):
-            return jsonify({
-                'error': 'Unauthorized',
-                'message': 'Invalid email or password'
-            }), 401
+        # Upgrade hashes made with another bcrypt cost now that we have the
+        # plaintext, so changing BCRYPT_COST migrates users as they log in
+        if password_needs_rehash(password_hash):
+            db.execute(
+                update(User)
+                .where(User.user_id == user_id)
+                .values(password_hash=hash_password(password))
+            )
+            db.commit()
         
         # Create JWT token
-        access_token = create_access_token(identity=user.user_id)
+        access_token = _mint_or_reuse(user_id)
         
-        return jsonify({
-            'token': access_token,
-            'user': user.to_dict()
-        }), 200
+        return _auth_response(access_token, user_json, 200)
     
-    except Exception as e:
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': str(e)
-        }), 500
+    except SQLAlchemyError:
+        db.rollback()
+        current_app.logger.exception('Login failed')
+        return _error_response('internal_error')
 
 
 @auth_bp.route('/register', methods=['POST'])
@@ -257,101 +438,67 @@ def register():
               type: string
               example: Email already exists
     """
-    db = None
+    data = _json_body()
+    
+    # Validate required fields
+    if not data:
+        return _error_response('missing_body')
+    
+    email = data.get('email')
+    password = data.get('password')
+    username = data.get('username')
+    
+    if not all(isinstance(field, str) and field for field in (email, password, username)):
+        return _error_response('register_fields_required')
+    
+    if len(email) > _MAX_EMAIL_LENGTH or len(password) > _MAX_PASSWORD_LENGTH:
+        return _error_response('fields_too_long')
+    
+    # Validate email format
+    if not is_valid_email(email, strict=current_app.config.get('STRICT_EMAIL_VALIDATION')):
+        return _error_response('invalid_email')
+    
+    # Validate username length
+    if len(username) < 3 or len(username) > 20:
+        return _error_response('invalid_username_length')
+    
+    # Validate password strength
+    is_valid, message = validate_password_strength(password)
+    if not is_valid:
+        return jsonify({
+            'error': 'Bad Request',
+            'message': message
+        }), 400
+    
+    # Get database session
+    db = get_db()
+    
     try:
-        data = request.get_json()
-        
-        # Validate required fields
-        if not data:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Request body is required'
-            }), 400
-        
-        email = data.get('email')
-        password = data.get('password')
-        username = data.get('username')
-        
-        if not email or not password or not username:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Email, password, and username are required'
-            }), 400
-        
-        # Validate email format
-        try:
-            validate_email(email, check_deliverability=False)
-        except EmailNotValidError:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Invalid email format'
-            }), 400
-        
-        # Validate username length
-        if len(username) < 3 or len(username) > 20:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Username must be between 3 and 20 characters'
-            }), 400
-        
-        # Validate password strength
-        is_valid, message = validate_password_strength(password)
-        if not is_valid:
-            return jsonify({
-                'error': 'Bad Request',
-                'message': message
-            }), 400
-        
-        # Get database session
-        db = get_db()
-        
-        # Check if user already exists
-        existing_user = db.query(User).filter(
-            (User.email == email) | (User.username == username)
-        ).first()
-        
-        if existing_user:
-            if existing_user.email == email:
-                return jsonify({
-                    'error': 'Conflict',
-                    'message': 'Email already exists'
-                }), 409
-            else:
-                return jsonify({
-                    'error': 'Conflict',
-                    'message': 'Username already exists'
-                }), 409
-        
-        # Create new user
+        # Create new user. Uniqueness is enforced by the unique indexes on
+        # email and username, so there is no SELECT before the INSERT.
         new_user = User(
             email=email,
             username=username
         )
         new_user.set_password(password)
         
-        try:
-            db.add(new_user)
-            db.commit()
-            db.refresh(new_user)
-        except IntegrityError:
-            db.rollback()
-            return jsonify({
-                'error': 'Conflict',
-                'message': 'Email or username already exists'
-            }), 409
-        
-        # Create JWT token
-        access_token = create_access_token(identity=new_user.user_id)
-        
-        return jsonify({
-            'token': access_token,
-            'user': new_user.to_dict()
-        }), 201
+        db.add(new_user)
+        db.commit()
     
-    except Exception as e:
-        if db is not None:
-            db.rollback()
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': str(e)
-        }), 500
+    except IntegrityError as e:
+        db.rollback()
+        conflict = _register_conflict(db, e, email, username)
+        if conflict is None:
+            current_app.logger.exception('Registration failed')
+            return _error_response('internal_error')
+        return _error_response(conflict)
+    
+    except SQLAlchemyError:
+        db.rollback()
+        current_app.logger.exception('Registration failed')
+        return _error_response('internal_error')
+    
+    # Create JWT token
+    access_token = _mint_or_reuse(new_user.user_id)
+    
+    return _auth_response(access_token, new_user.to_json(), 201)
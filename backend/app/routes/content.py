@@ -5,12 +5,19 @@ These endpoints are public (no JWT required).
 They fetch data from external APIs and cache in PostgreSQL.
 """
 
-import asyncio
-from flask import Blueprint, request, jsonify
-from sqlalchemy.exc import IntegrityError
+import functools
+import hashlib
+import orjson
+from datetime import datetime
+from flask import Blueprint, request, jsonify, current_app
+from sqlalchemy import Enum, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.database import get_db
 from app.models.content import Movie, Album, Game, Book, Location, MovieType, GameDifficulty
 from app.services.external_apis import movies, albums, games, books, locations
+from app.services.external_apis.base import run_async
+from app.services.cache import cached_count, cached_search
 
 content_bp = Blueprint('content', __name__)
 
@@ -21,94 +28,193 @@ content_bp = Blueprint('content', __name__)
 
 def get_pagination_params():
     """Extract and validate limit/offset from query params"""
+    args = request.args
+    # Most requests use the defaults
+    if 'limit' not in args and 'offset' not in args:
+        return 20, 0
     try:
-        limit = int(request.args.get('limit', 20))
-        offset = int(request.args.get('offset', 0))
-        # Enforce reasonable limits
-        limit = max(1, min(limit, 100))
-        offset = max(0, offset)
-        return limit, offset
+        limit = int(args.get('limit', 20))
+        offset = int(args.get('offset', 0))
     except (ValueError, TypeError):
         return 20, 0
+    # Enforce reasonable limits
+    return max(1, min(limit, 100)), max(0, offset)
+
+
+# API field names that differ from the column names
+_COLUMN_RENAMES = {'totalPages': 'total_pages'}
+
+
+def _enum_member(enum_class, value):
+    """enum_class(value) as a plain dict lookup, skipping Enum.__call__"""
+    member = enum_class._value2member_map_.get(value)
+    if member is None:
+        raise ValueError(f"{value!r} is not a valid {enum_class.__name__}")
+    return member
 
 
-def save_or_update_movie(db, movie_data):
-    """Save or update a movie in the database"""
-    existing = db.query(Movie).filter_by(id=movie_data['id']).first()
-    if existing:
-        # Update existing
-        for key, value in movie_data.items():
-            if key == 'type' and isinstance(value, str):
-                value = MovieType(value)
-            setattr(existing, key, value)
-        return existing
-    else:
-        # Create new
-        if isinstance(movie_data.get('type'), str):
-            movie_data['type'] = MovieType(movie_data['type'])
-        movie = Movie(**movie_data)
-        db.add(movie)
-        return movie
-
-
-def save_or_update_album(db, album_data):
-    """Save or update an album in the database"""
-    existing = db.query(Album).filter_by(id=album_data['id']).first()
-    if existing:
-        for key, value in album_data.items():
-            setattr(existing, key, value)
-        return existing
-    else:
-        album = Album(**album_data)
-        db.add(album)
-        return album
-
-
-def save_or_update_game(db, game_data):
-    """Save or update a game in the database"""
-    existing = db.query(Game).filter_by(id=game_data['id']).first()
-    if existing:
-        for key, value in game_data.items():
-            if key == 'difficulty' and value and isinstance(value, str):
-                value = GameDifficulty(value)
-            setattr(existing, key, value)
-        return existing
-    else:
-        if game_data.get('difficulty') and isinstance(game_data['difficulty'], str):
-            game_data['difficulty'] = GameDifficulty(game_data['difficulty'])
-        game = Game(**game_data)
-        db.add(game)
-        return game
-
-
-def save_or_update_book(db, book_data):
-    """Save or update a book in the database"""
-    # Map totalPages to total_pages
-    if 'totalPages' in book_data:
-        book_data['total_pages'] = book_data.pop('totalPages')
+def _column_values(table, item):
+    """
+    Map an API item onto table's columns: rename fields, convert enum
+    strings, drop unknown keys. Raises ValueError on an invalid enum value.
+    """
+    values = {}
+    for key, value in item.items():
+        column = table.columns.get(_COLUMN_RENAMES.get(key, key))
+        if column is None:
+            continue
+        if isinstance(value, str) and isinstance(column.type, Enum) and column.type.enum_class:
+            value = _enum_member(column.type.enum_class, value)
+        values[column.name] = value
+    return values
+
+
+def _upsert_row(table, values, now):
+    """Fill every column of table from converted values, for an upsert"""
+    row = {}
+    for column in table.columns:
+        value = values.get(column.name)
+        if value is None and column.default is not None and column.default.is_scalar:
+            value = column.default.arg
+        row[column.name] = value
+    row['created_at'] = row['updated_at'] = now
+    return row
+
+
+def _upsert_statement(table, rows):
+    """
+    INSERT ... ON CONFLICT (id) DO UPDATE for rows.
+    
+    Fields an item leaves out (or sets to None) keep their stored value.
+    """
+    stmt = pg_insert(table).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={
+            column.name: (
+                stmt.excluded[column.name] if column.name == 'updated_at'
+                else func.coalesce(stmt.excluded[column.name], column)
+            )
+            for column in table.columns
+            if column.name not in ('id', 'created_at')
+        }
+    )
+
+
+def bulk_upsert(db, model, items):
+    """Insert or update a batch of normalized API items in one statement"""
+    table = model.__table__
+    now = datetime.utcnow()
+    rows = {}
+    for item in items:
+        try:
+            values = _column_values(table, item)
+        except ValueError as e:
+            current_app.logger.warning('Skipping %s row %s: %s', table.name, item.get('id'), e)
+            continue
+        rows[values['id']] = _upsert_row(table, values, now)  # one row per id, or Postgres rejects the batch
+    if rows:
+        db.execute(_upsert_statement(table, list(rows.values())))
+
+
+def make_save_or_update(model):
+    """Build the save-or-update helper for one content model"""
+    table = model.__table__
+    
+    def save_or_update(db, data):
+        # Core upsert: no SELECT first and no ORM change tracking. The
+        # stored row comes back via RETURNING and is handed out detached.
+        row = _upsert_row(table, _column_values(table, data), datetime.utcnow())
+        stored = db.execute(_upsert_statement(table, [row]).returning(*table.columns)).one()
+        return model(**stored._mapping)
+    
+    save_or_update.__name__ = f'save_or_update_{model.__tablename__[:-1]}'
+    save_or_update.__doc__ = f'Save or update a {model.__name__.lower()} in the database'
+    return save_or_update
+
+
+save_or_update_movie = make_save_or_update(Movie)
+save_or_update_album = make_save_or_update(Album)
+save_or_update_game = make_save_or_update(Game)
+save_or_update_book = make_save_or_update(Book)
+save_or_update_location = make_save_or_update(Location)
+
+
+@functools.cache
+def _list_statements(model):
+    """Base COUNT and page SELECT for a content table, built once per model"""
+    table = model.__table__
+    columns = [c for c in table.columns if c.name not in ('created_at', 'updated_at')]
+    return select(func.count()).select_from(table), select(*columns)
+
+
+# Query-string filters each list endpoint accepts, as name -> clause builder
+_LIST_FILTERS = {
+    Movie: {
+        'year': lambda value: Movie.year == value,
+        'type': lambda value: Movie.type == _enum_member(MovieType, value),
+    },
+    Game: {
+        'platform': lambda value: Game.platform.ilike(f'%{value}%'),
+        'difficulty': lambda value: Game.difficulty == _enum_member(GameDifficulty, value),
+    },
+}
+
+def count_rows(db, model, clauses, filters):
+    """
+    Total rows matching clauses, cached briefly per table and filter set.
     
-    existing = db.query(Book).filter_by(id=book_data['id']).first()
-    if existing:
-        for key, value in book_data.items():
-            setattr(existing, key, value)
-        return existing
-    else:
-        book = Book(**book_data)
-        db.add(book)
-        return book
-
-
-def save_or_update_location(db, location_data):
-    """Save or update a location in the database"""
-    existing = db.query(Location).filter_by(id=location_data['id']).first()
-    if existing:
-        for key, value in location_data.items():
-            setattr(existing, key, value)
-        return existing
-    else:
-        location = Location(**location_data)
-        db.add(location)
-        return location
+    Always an exact COUNT: clients page until offset reaches total, so an
+    estimate would end their paging early or send them past the end.
+    """
+    def load():
+        count_stmt, _ = _list_statements(model)
+        return db.execute(count_stmt.where(*clauses)).scalar()
+    
+    return cached_count((model.__tablename__, tuple(sorted(filters.items()))), load)
+
+
+def list_page(db, model, limit, offset, **filters):
+    """
+    Return (items, total) for one page of a content table.
+    
+    filters are the endpoint's query-string filters (see _LIST_FILTERS);
+    empty ones are ignored. Reads plain Core rows instead of ORM instances;
+    to_dict() only reads attributes, so it serializes the rows directly.
+    """
+    filters = {name: value for name, value in filters.items() if value}
+    builders = _LIST_FILTERS.get(model, {})
+    clauses = [builders[name](value) for name, value in filters.items()]
+    total = count_rows(db, model, clauses, filters)
+    _, page_stmt = _list_statements(model)
+    rows = db.execute(page_stmt.where(*clauses).offset(offset).limit(limit))
+    return [model.to_dict(row) for row in rows], total
+
+
+# Every list response has the same shape, so only the values are encoded
+# per request
+_PAGE_FRAME = b'{"data":%b,"total":%b,"limit":%d,"offset":%d}\n'
+
+
+def page_response(data, total, limit, offset):
+    """JSON response for one page of list results"""
+    body = _PAGE_FRAME % (
+        orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS), orjson.dumps(total), limit, offset
+    )
+    return current_app.response_class(body, mimetype='application/json')
+
+
+def list_response(data, total, limit, offset):
+    """
+    page_response() for a database list page, with a weak ETag over the body.
+    
+    Browsers and proxies may reuse it for a minute; a matching If-None-Match
+    gets an empty 304 instead of the page.
+    """
+    response = page_response(data, total, limit, offset)
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest(), weak=True)
+    response.headers['Cache-Control'] = 'public, max-age=60, stale-while-revalidate=300'
+    return response.make_conditional(request)
 
 
 # ────────────────────────────────────────────────────────────────
@@ -149,6 +255,8 @@ def get_movies():
     responses:
       200:
         description: Movies list
+      304:
+        description: Not modified since the ETag in If-None-Match
       400:
         description: Bad request
     """
@@ -162,59 +270,39 @@ def get_movies():
         
         # If search query provided, fetch from external API
         if search:
-            # Run async function in event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # Run on the shared external API event loop
             try:
-                result = loop.run_until_complete(
-                    movies.search_movies(
+                result, cached = cached_search(
+                    'movies',
+                    (search, year, type_filter, limit, offset),
+                    lambda: run_async(movies.search_movies(
                         search,
                         year=year,
                         type_filter=type_filter,
                         limit=limit,
                         offset=offset
-                    )
+                    ))
                 )
                 
-                # Save results to database
-                for movie_data in result['data']:
+                # Save results to database (already saved if served from cache)
+                if not cached:
                     try:
-                        save_or_update_movie(db, movie_data)
-                    except Exception as e:
-                        print(f"Error saving movie: {e}")
-                
-                db.commit()
+                        bulk_upsert(db, Movie, result['data'])
+                        db.commit()
+                    except SQLAlchemyError:
+                        db.rollback()
+                        current_app.logger.exception('Error saving movies')
                 
-                return jsonify({
-                    'data': result['data'],
-                    'total': result['total'],
-                    'limit': limit,
-                    'offset': offset
-                }), 200
+                return page_response(result['data'], result['total'], limit, offset)
             except Exception as api_error:
                 # If external API fails (e.g., missing API key), fall back to database
-                print(f"External API error: {api_error}")
+                current_app.logger.warning('External API error: %s', api_error)
                 # Continue to database query below
-            finally:
-                loop.close()
         
         # Otherwise, query from database
-        query = db.query(Movie)
-        
-        if year:
-            query = query.filter(Movie.year == year)
-        if type_filter:
-            query = query.filter(Movie.type == MovieType(type_filter))
-        
-        total = query.count()
-        movies_list = query.offset(offset).limit(limit).all()
+        data, total = list_page(db, Movie, limit, offset, year=year, type=type_filter)
         
-        return jsonify({
-            'data': [m.to_dict() for m in movies_list],
-            'total': total,
-            'limit': limit,
-            'offset': offset
-        }), 200
+        return list_response(data, total, limit, offset)
         
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -249,23 +337,18 @@ def get_movie_by_id(movie_id):
         
         if not movie:
             # Try fetching from external API
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             try:
-                try:
-                    movie_data = loop.run_until_complete(movies.get_movie_by_id(movie_id))
-                    
-                    if movie_data:
-                        movie = save_or_update_movie(db, movie_data)
-                        db.commit()
-                    else:
-                        return jsonify({'error': 'Movie not found'}), 404
-                except Exception as api_error:
-                    # If external API fails, return 404
-                    print(f"External API error: {api_error}")
+                movie_data = run_async(movies.get_movie_by_id(movie_id))
+                
+                if movie_data:
+                    movie = save_or_update_movie(db, movie_data)
+                    db.commit()
+                else:
                     return jsonify({'error': 'Movie not found'}), 404
-            finally:
-                loop.close()
+            except Exception as api_error:
+                # If external API fails, return 404
+                current_app.logger.warning('External API error: %s', api_error)
+                return jsonify({'error': 'Movie not found'}), 404
         
         return jsonify(movie.to_dict()), 200
         
@@ -306,6 +389,8 @@ def get_albums():
     responses:
       200:
         description: Albums list
+      304:
+        description: Not modified since the ETag in If-None-Match
       400:
         description: Bad request
     """
@@ -318,47 +403,32 @@ def get_albums():
         
         # If search query provided, fetch from external API
         if search or artist_filter:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(
-                    albums.search_albums(
-                        search or artist_filter,
-                        artist=artist_filter if artist_filter else None,
-                        limit=limit,
-                        offset=offset
-                    )
-                )
-            finally:
-                loop.close()
+            result, cached = cached_search(
+                'albums',
+                (search, artist_filter, limit, offset),
+                lambda: run_async(albums.search_albums(
+                    search or artist_filter,
+                    artist=artist_filter if artist_filter else None,
+                    limit=limit,
+                    offset=offset
+                ))
+            )
             
-            # Save results to database
-            for album_data in result['data']:
+            # Save results to database (already saved if served from cache)
+            if not cached:
                 try:
-                    save_or_update_album(db, album_data)
-                except Exception as e:
-                    print(f"Error saving album: {e}")
-            
-            db.commit()
+                    bulk_upsert(db, Album, result['data'])
+                    db.commit()
+                except SQLAlchemyError:
+                    db.rollback()
+                    current_app.logger.exception('Error saving albums')
             
-            return jsonify({
-                'data': result['data'],
-                'total': result['total'],
-                'limit': limit,
-                'offset': offset
-            }), 200
+            return page_response(result['data'], result['total'], limit, offset)
         
         # Otherwise, query from database
-        query = db.query(Album)
-        total = query.count()
-        albums_list = query.offset(offset).limit(limit).all()
+        data, total = list_page(db, Album, limit, offset)
         
-        return jsonify({
-            'data': [a.to_dict() for a in albums_list],
-            'total': total,
-            'limit': limit,
-            'offset': offset
-        }), 200
+        return list_response(data, total, limit, offset)
         
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -393,12 +463,7 @@ def get_album_by_id(album_id):
         
         if not album:
             # Try fetching from external API
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                album_data = loop.run_until_complete(albums.get_album_by_id(album_id))
-            finally:
-                loop.close()
+            album_data = run_async(albums.get_album_by_id(album_id))
             
             if album_data:
                 album = save_or_update_album(db, album_data)
@@ -450,6 +515,8 @@ def get_games():
     responses:
       200:
         description: Games list
+      304:
+        description: Not modified since the ETag in If-None-Match
       400:
         description: Bad request
     """
@@ -463,54 +530,33 @@ def get_games():
         
         # If search query provided, fetch from external API
         if search:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(
-                    games.search_games(
-                        search,
-                        platform=platform if platform else None,
-                        difficulty=difficulty if difficulty else None,
-                        limit=limit,
-                        offset=offset
-                    )
-                )
-            finally:
-                loop.close()
+            result, cached = cached_search(
+                'games',
+                (search, platform, difficulty, limit, offset),
+                lambda: run_async(games.search_games(
+                    search,
+                    platform=platform if platform else None,
+                    difficulty=difficulty if difficulty else None,
+                    limit=limit,
+                    offset=offset
+                ))
+            )
             
-            # Save results to database
-            for game_data in result['data']:
+            # Save results to database (already saved if served from cache)
+            if not cached:
                 try:
-                    save_or_update_game(db, game_data)
-                except Exception as e:
-                    print(f"Error saving game: {e}")
+                    bulk_upsert(db, Game, result['data'])
+                    db.commit()
+                except SQLAlchemyError:
+                    db.rollback()
+                    current_app.logger.exception('Error saving games')
             
-            db.commit()
-            
-            return jsonify({
-                'data': result['data'],
-                'total': result['total'],
-                'limit': limit,
-                'offset': offset
-            }), 200
+            return page_response(result['data'], result['total'], limit, offset)
         
         # Otherwise, query from database
-        query = db.query(Game)
-        
-        if platform:
-            query = query.filter(Game.platform.ilike(f'%{platform}%'))
-        if difficulty:
-            query = query.filter(Game.difficulty == GameDifficulty(difficulty))
+        data, total = list_page(db, Game, limit, offset, platform=platform, difficulty=difficulty)
         
-        total = query.count()
-        games_list = query.offset(offset).limit(limit).all()
-        
-        return jsonify({
-            'data': [g.to_dict() for g in games_list],
-            'total': total,
-            'limit': limit,
-            'offset': offset
-        }), 200
+        return list_response(data, total, limit, offset)
         
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -545,23 +591,18 @@ def get_game_by_id(game_id):
         
         if not game:
             # Try fetching from external API
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             try:
-                try:
-                    game_data = loop.run_until_complete(games.get_game_by_id(game_id))
-                    
-                    if game_data:
-                        game = save_or_update_game(db, game_data)
-                        db.commit()
-                    else:
-                        return jsonify({'error': 'Game not found'}), 404
-                except Exception as api_error:
-                    # If external API fails, return 404
-                    print(f"External API error: {api_error}")
+                game_data = run_async(games.get_game_by_id(game_id))
+                
+                if game_data:
+                    game = save_or_update_game(db, game_data)
+                    db.commit()
+                else:
                     return jsonify({'error': 'Game not found'}), 404
-            finally:
-                loop.close()
+            except Exception as api_error:
+                # If external API fails, return 404
+                current_app.logger.warning('External API error: %s', api_error)
+                return jsonify({'error': 'Game not found'}), 404
         
         return jsonify(game.to_dict()), 200
         
@@ -602,6 +643,8 @@ def get_books():
     responses:
       200:
         description: Books list
+      304:
+        description: Not modified since the ETag in If-None-Match
       400:
         description: Bad request
     """
@@ -614,47 +657,32 @@ def get_books():
         
         # If search query provided, fetch from external API
         if search or author_filter:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(
-                    books.search_books(
-                        search or author_filter,
-                        author=author_filter if author_filter else None,
-                        limit=limit,
-                        offset=offset
-                    )
-                )
-            finally:
-                loop.close()
+            result, cached = cached_search(
+                'books',
+                (search, author_filter, limit, offset),
+                lambda: run_async(books.search_books(
+                    search or author_filter,
+                    author=author_filter if author_filter else None,
+                    limit=limit,
+                    offset=offset
+                ))
+            )
             
-            # Save results to database
-            for book_data in result['data']:
+            # Save results to database (already saved if served from cache)
+            if not cached:
                 try:
-                    save_or_update_book(db, book_data)
-                except Exception as e:
-                    print(f"Error saving book: {e}")
+                    bulk_upsert(db, Book, result['data'])
+                    db.commit()
+                except SQLAlchemyError:
+                    db.rollback()
+                    current_app.logger.exception('Error saving books')
             
-            db.commit()
-            
-            return jsonify({
-                'data': result['data'],
-                'total': result['total'],
-                'limit': limit,
-                'offset': offset
-            }), 200
+            return page_response(result['data'], result['total'], limit, offset)
         
         # Otherwise, query from database
-        query = db.query(Book)
-        total = query.count()
-        books_list = query.offset(offset).limit(limit).all()
+        data, total = list_page(db, Book, limit, offset)
         
-        return jsonify({
-            'data': [b.to_dict() for b in books_list],
-            'total': total,
-            'limit': limit,
-            'offset': offset
-        }), 200
+        return list_response(data, total, limit, offset)
         
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -689,12 +717,7 @@ def get_book_by_id(book_id):
         
         if not book:
             # Try fetching from external API
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                book_data = loop.run_until_complete(books.get_book_by_id(book_id))
-            finally:
-                loop.close()
+            book_data = run_async(books.get_book_by_id(book_id))
             
             if book_data:
                 book = save_or_update_book(db, book_data)
@@ -741,6 +764,8 @@ def get_locations():
     responses:
       200:
         description: Locations list
+      304:
+        description: Not modified since the ETag in If-None-Match
       400:
         description: Bad request
     """
@@ -753,47 +778,32 @@ def get_locations():
         
         # If search query provided, fetch from external API
         if search or country:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(
-                    locations.search_locations(
-                        search or country,
-                        country=country if country else None,
-                        limit=limit,
-                        offset=offset
-                    )
-                )
-            finally:
-                loop.close()
+            result, cached = cached_search(
+                'locations',
+                (search, country, limit, offset),
+                lambda: run_async(locations.search_locations(
+                    search or country,
+                    country=country if country else None,
+                    limit=limit,
+                    offset=offset
+                ))
+            )
             
-            # Save results to database
-            for location_data in result['data']:
+            # Save results to database (already saved if served from cache)
+            if not cached:
                 try:
-                    save_or_update_location(db, location_data)
-                except Exception as e:
-                    print(f"Error saving location: {e}")
+                    bulk_upsert(db, Location, result['data'])
+                    db.commit()
+                except SQLAlchemyError:
+                    db.rollback()
+                    current_app.logger.exception('Error saving locations')
             
-            db.commit()
-            
-            return jsonify({
-                'data': result['data'],
-                'total': result['total'],
-                'limit': limit,
-                'offset': offset
-            }), 200
+            return page_response(result['data'], result['total'], limit, offset)
         
         # Otherwise, query from database
-        query = db.query(Location)
-        total = query.count()
-        locations_list = query.offset(offset).limit(limit).all()
+        data, total = list_page(db, Location, limit, offset)
         
-        return jsonify({
-            'data': [loc.to_dict() for loc in locations_list],
-            'total': total,
-            'limit': limit,
-            'offset': offset
-        }), 200
+        return list_response(data, total, limit, offset)
         
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -828,12 +838,7 @@ def get_location_by_id(location_id):
         
         if not location:
             # Try fetching from external API
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                location_data = loop.run_until_complete(locations.get_location_by_id(location_id))
-            finally:
-                loop.close()
+            location_data = run_async(locations.get_location_by_id(location_id))
             
             if location_data:
                 location = save_or_update_location(db, location_data)
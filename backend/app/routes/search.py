@@ -4,13 +4,113 @@ Global Search Route
 Provides search across all content types (movies, albums, games, books, locations)
 """
 
-from flask import Blueprint, request, jsonify
+import functools
+import orjson
+from flask import Blueprint, request, jsonify, current_app
+from sqlalchemy import select, union_all, or_, func, literal_column, cast, String, Text, bindparam
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from app.database import get_db
 from app.models.content import Movie, Album, Game, Book, Location
 
 search_bp = Blueprint('search', __name__)
 
 
+def _jsonb_object(fields):
+    """jsonb_build_object() over (key, column) pairs, keys inlined as SQL literals"""
+    return func.jsonb_build_object(*[
+        x for key, column in fields for x in (literal_column(f"'{key}'"), column)
+    ])
+
+
+def _search_leg(position, category, type_, fields, optional_fields, search_columns):
+    """
+    Build one category's SELECT for the global search UNION ALL.
+    
+    Each row carries the result as JSONB: category and type plus the item
+    shaped like the model's to_dict(), with optional_fields only when not NULL.
+    """
+    item = _jsonb_object([
+        ('category', literal_column(f"'{category}'")),
+        ('type', literal_column(f"'{type_}'")),
+        *fields
+    ])
+    if optional_fields:
+        item = item.op('||')(func.jsonb_strip_nulls(_jsonb_object(optional_fields)))
+    
+    pattern = bindparam('pattern')
+    leg = select(
+        literal_column(str(position)).label('position'),
+        item.label('item')
+    ).where(or_(*[column.ilike(pattern) for column in search_columns])).limit(bindparam('limit'))
+    
+    return category, leg
+
+
+# Categories in response order. Enums are stored by name (MOVIE, EASY), so
+# they are mapped back to their values (movie, Easy) in SQL.
+_SEARCH_LEGS = (
+    _search_leg(
+        0, 'cinema', 'movie',
+        [('id', Movie.id), ('title', Movie.title), ('year', Movie.year),
+         ('director', Movie.director), ('type', func.lower(cast(Movie.type, String))),
+         ('url', Movie.url)],
+        [('poster', Movie.poster), ('season', Movie.season), ('episode', Movie.episode)],
+        (Movie.title, Movie.director)
+    ),
+    _search_leg(
+        1, 'music', 'album',
+        [('id', Album.id), ('title', Album.title), ('artist', Album.artist), ('url', Album.url)],
+        [('cover', Album.cover), ('duration', Album.duration)],
+        (Album.title, Album.artist)
+    ),
+    _search_leg(
+        2, 'games', 'game',
+        [('id', Game.id), ('title', Game.title), ('platform', Game.platform), ('url', Game.url)],
+        [('cover', Game.cover), ('difficulty', func.initcap(cast(Game.difficulty, String)))],
+        (Game.title,)
+    ),
+    _search_leg(
+        3, 'books', 'book',
+        [('id', Book.id), ('title', Book.title), ('author', Book.author), ('url', Book.url)],
+        [('cover', Book.cover), ('totalPages', Book.total_pages)],
+        (Book.title, Book.author)
+    ),
+    _search_leg(
+        4, 'travel', 'location',
+        [('id', Location.id), ('name', Location.name), ('city', Location.city),
+         ('country', Location.country), ('url', Location.url)],
+        [('image', Location.image), ('weather', Location.weather),
+         ('temperature', Location.temperature), ('timezone', Location.timezone)],
+        (Location.name, Location.city, Location.country)
+    ),
+)
+_SEARCH_CATEGORIES = frozenset(category for category, _ in _SEARCH_LEGS)
+
+
+@functools.cache
+def _search_statement(categories):
+    """
+    Search over the given categories, or None if none match.
+    
+    Returns one row: the results as JSON text, aggregated in Postgres so no
+    per-row dicts are built in Python, and their count. Built once per
+    category combination; callers pass a subset of _SEARCH_CATEGORIES, so
+    the cache holds at most 32 statements. The query string and limit are bound at execute
+    time, so the compiled SQL is reused for every search.
+    """
+    legs = [leg for category, leg in _SEARCH_LEGS if category in categories]
+    if not legs:
+        return None
+    matches = union_all(*legs).subquery()
+    return select(
+        cast(func.coalesce(
+            func.jsonb_agg(aggregate_order_by(matches.c.item, matches.c.position)),
+            literal_column("'[]'::jsonb")
+        ), Text),
+        func.count()
+    ).select_from(matches)
+
+
 @search_bp.route('', methods=['GET'])
 def global_search():
     """
@@ -59,75 +159,23 @@ def global_search():
             categories = ['cinema', 'music', 'games', 'books', 'travel']
         
         db = get_db()
-        results = {
-            'query': query_string,
-            'results': [],
-            'total': 0
-        }
-        
-        # Search movies/TV (cinema)
-        if 'cinema' in categories:
-            movies = db.query(Movie).filter(
-                (Movie.title.ilike(f'%{query_string}%')) | 
-                (Movie.director.ilike(f'%{query_string}%'))
-            ).limit(limit).all()
-            results['results'].extend([{
-                'category': 'cinema',
-                'type': 'movie',
-                **m.to_dict()
-            } for m in movies])
-        
-        # Search albums (music)
-        if 'music' in categories:
-            albums = db.query(Album).filter(
-                (Album.title.ilike(f'%{query_string}%')) |
-                (Album.artist.ilike(f'%{query_string}%'))
-            ).limit(limit).all()
-            results['results'].extend([{
-                'category': 'music',
-                'type': 'album',
-                **a.to_dict()
-            } for a in albums])
+        # Unknown categories are ignored; dropping them before the cached
+        # lookup keeps arbitrary ?categories= strings from growing the cache
+        statement = _search_statement(_SEARCH_CATEGORIES.intersection(categories))
         
-        # Search games
-        if 'games' in categories:
-            games_list = db.query(Game).filter(
-                Game.title.ilike(f'%{query_string}%')
-            ).limit(limit).all()
-            results['results'].extend([{
-                'category': 'games',
-                'type': 'game',
-                **g.to_dict()
-            } for g in games_list])
-        
-        # Search books
-        if 'books' in categories:
-            books_list = db.query(Book).filter(
-                (Book.title.ilike(f'%{query_string}%')) |
-                (Book.author.ilike(f'%{query_string}%'))
-            ).limit(limit).all()
-            results['results'].extend([{
-                'category': 'books',
-                'type': 'book',
-                **b.to_dict()
-            } for b in books_list])
-        
-        # Search locations (travel)
-        if 'travel' in categories:
-            locations_list = db.query(Location).filter(
-                (Location.name.ilike(f'%{query_string}%')) |
-                (Location.city.ilike(f'%{query_string}%')) |
-                (Location.country.ilike(f'%{query_string}%'))
-            ).limit(limit).all()
-            results['results'].extend([{
-                'category': 'travel',
-                'type': 'location',
-                **loc.to_dict()
-            } for loc in locations_list])
-        
-        results['total'] = len(results['results'])
+        # One round trip for every requested category
+        if statement is not None:
+            results, total = db.execute(
+                statement, {'pattern': f'%{query_string}%', 'limit': limit}
+            ).one()
+        else:
+            results, total = '[]', 0
         
-        return jsonify(results), 200
+        # Splice the JSON from Postgres in as-is
+        body = b'{"query":%s,"results":%s,"total":%d}\n' % (
+            orjson.dumps(query_string), results.encode('utf-8'), total
+        )
+        return current_app.response_class(body, mimetype='application/json'), 200
         
     except Exception as e:
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
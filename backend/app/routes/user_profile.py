@@ -1,10 +1,73 @@
-from flask import Blueprint, request, jsonify
+import orjson
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import select, update, bindparam
 from app.database import get_db
 from app.models.user import User
 
 user_profile_bp = Blueprint('user_profile', __name__)
 
+# Largest profile update body: a 500-character bio plus an avatar, which
+# may be an image data URL rather than a link
+_MAX_PROFILE_BODY = 2 * 1024 * 1024  # bytes
+
+# Only the columns a profile response shows; never the password hash or
+# the aura JSONB. Rows come back as plain tuples, not ORM instances.
+_PROFILE_FIELDS = (
+    User.user_id, User.email, User.username, User.avatar, User.bio,
+    User.created_at, User.updated_at
+)
+_PROFILE_COLUMNS = select(*_PROFILE_FIELDS)
+_PROFILE_STMT = _PROFILE_COLUMNS.where(User.user_id == bindparam('user_id'))
+
+# Bulk lookups return public profiles without email: user IDs are public
+# (shares, aura profiles), so many at once must not become an email list.
+# Columns are labelled with their response keys.
+_BULK_PROFILE_STMT = select(
+    User.user_id.label('userId'),
+    User.username.label('username'),
+    User.avatar.label('avatar'),
+    User.bio.label('bio'),
+    User.created_at.label('createdAt'),
+    User.updated_at.label('updatedAt'),
+).where(User.user_id.in_(bindparam('user_ids', expanding=True)))
+
+
+def _profile_response(row):
+    """200 response for a row with the _PROFILE_FIELDS columns"""
+    # to_json() only reads attributes, so it serializes the row directly
+    return current_app.response_class(User.to_json(row) + b'\n', mimetype='application/json')
+
+
+def _body_too_large():
+    """413 response for a profile update over _MAX_PROFILE_BODY"""
+    return jsonify({
+        'error': 'Payload Too Large',
+        'message': 'Request body is too large'
+    }), 413
+
+
+def _cached_profile_response(row, public):
+    """
+    _profile_response() with a weak ETag from updated_at.
+    
+    Every profile change bumps updated_at, so a matching If-None-Match gets
+    an empty 304 without serializing. Clients and proxies must revalidate
+    before reusing a copy.
+    """
+    etag = row.updated_at.strftime('%Y%m%d%H%M%S%f')
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = _profile_response(row)
+    response.set_etag(etag, weak=True)
+    if public:
+        response.cache_control.public = True
+    else:
+        response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
 
 @user_profile_bp.route('/profile', methods=['GET'])
 @jwt_required()
@@ -45,6 +108,8 @@ def get_user_profile():
             updatedAt:
               type: string
               format: date-time
+      304:
+        description: Not modified since the ETag in If-None-Match
       401:
         description: Unauthorized - authentication required
         schema:
@@ -65,7 +130,7 @@ def get_user_profile():
         db = get_db()
         
         # Find user by ID
-        user = db.query(User).filter_by(user_id=current_user_id).first()
+        user = db.execute(_PROFILE_STMT, {'user_id': current_user_id}).first()
         
         if not user:
             return jsonify({
@@ -73,7 +138,7 @@ def get_user_profile():
                 'message': 'User not found'
             }), 404
         
-        return jsonify(user.to_dict()), 200
+        return _cached_profile_response(user, public=False)
     
     except Exception as e:
         return jsonify({
@@ -159,13 +224,29 @@ def update_user_profile():
             message:
               type: string
               example: Missing or invalid authentication token
+      413:
+        description: Request body too large
     """
     db = None
     try:
         # Get current user ID from JWT token
         current_user_id = get_jwt_identity()
         
-        data = request.get_json()
+        # Refuse oversized bodies before reading or parsing them. Chunked
+        # uploads carry no Content-Length, so read one byte past the limit
+        # to tell whether the body fits.
+        if request.content_length is None:
+            body = request.stream.read(_MAX_PROFILE_BODY + 1)
+            if len(body) > _MAX_PROFILE_BODY:
+                return _body_too_large()
+            try:
+                data = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                data = None
+        elif request.content_length > _MAX_PROFILE_BODY:
+            return _body_too_large()
+        else:
+            data = request.get_json(cache=False)
         
         if not data:
             return jsonify({
@@ -173,19 +254,8 @@ def update_user_profile():
                 'message': 'Request body is required'
             }), 400
         
-        # Get database session
-        db = get_db()
-        
-        # Find user by ID
-        user = db.query(User).filter_by(user_id=current_user_id).first()
-        
-        if not user:
-            return jsonify({
-                'error': 'Not Found',
-                'message': 'User not found'
-            }), 404
-        
-        # Update allowed fields
+        # Collect allowed fields
+        updates = {}
         if 'bio' in data:
             bio = data['bio']
             if bio is not None and len(bio) > 500:
@@ -193,16 +263,34 @@ def update_user_profile():
                     'error': 'Bad Request',
                     'message': 'Bio must be 500 characters or less'
                 }), 400
-            user.bio = bio
+            updates['bio'] = bio
         
         if 'avatar' in data:
-            user.avatar = data['avatar']
+            updates['avatar'] = data['avatar']
         
-        # Commit changes
-        db.commit()
-        db.refresh(user)
+        # Get database session
+        db = get_db()
+        
+        if updates:
+            # One round trip: the UPDATE (updated_at set by its onupdate)
+            # returns the profile it wrote
+            user = db.execute(
+                update(User)
+                .where(User.user_id == current_user_id)
+                .values(**updates)
+                .returning(*_PROFILE_FIELDS)
+            ).first()
+            db.commit()
+        else:
+            user = db.execute(_PROFILE_STMT, {'user_id': current_user_id}).first()
+        
+        if not user:
+            return jsonify({
+                'error': 'Not Found',
+                'message': 'User not found'
+            }), 404
         
-        return jsonify(user.to_dict()), 200
+        return _profile_response(user)
     
     except Exception as e:
         if db is not None:
@@ -256,6 +344,8 @@ def get_user_by_id(user_id):
             updatedAt:
               type: string
               format: date-time
+      304:
+        description: Not modified since the ETag in If-None-Match
       404:
         description: User not found
         schema:
@@ -273,7 +363,7 @@ def get_user_by_id(user_id):
         db = get_db()
         
         # Find user by ID
-        user = db.query(User).filter_by(user_id=user_id).first()
+        user = db.execute(_PROFILE_STMT, {'user_id': user_id}).first()
         
         if not user:
             return jsonify({
@@ -281,7 +371,100 @@ def get_user_by_id(user_id):
                 'message': 'User not found'
             }), 404
         
-        return jsonify(user.to_dict()), 200
+        return _cached_profile_response(user, public=True)
+    
+    except Exception as e:
+        return jsonify({
+            'error': 'Internal Server Error',
+            'message': str(e)
+        }), 500
+
+
+# Most user IDs accepted by one bulk profile request
+_MAX_BULK_USER_IDS = 200
+
+
+@user_profile_bp.route('/bulk', methods=['POST'])
+def get_users_bulk():
+    """
+    Get many user profiles by ID in one request (public endpoint)
+    ---
+    tags:
+      - User Profile
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - userIds
+          properties:
+            userIds:
+              type: array
+              maxItems: 200
+              items:
+                type: string
+              example: [u_123abc456def, u_654fed321cba]
+    responses:
+      200:
+        description: Public profiles (no email) keyed by user ID; unknown IDs are left out
+        schema:
+          type: object
+          additionalProperties:
+            type: object
+            properties:
+              userId:
+                type: string
+              username:
+                type: string
+              avatar:
+                type: string
+                nullable: true
+              bio:
+                type: string
+                nullable: true
+              createdAt:
+                type: string
+                format: date-time
+              updatedAt:
+                type: string
+                format: date-time
+      400:
+        description: Bad request - userIds missing, not a list of strings, or too long
+        schema:
+          type: object
+          properties:
+            error:
+              type: string
+              example: Bad Request
+            message:
+              type: string
+              example: userIds must be a list of at most 200 user IDs
+    """
+    data = request.get_json(silent=True)
+    user_ids = data.get('userIds') if isinstance(data, dict) else None
+    
+    if (
+        not isinstance(user_ids, list)
+        or len(user_ids) > _MAX_BULK_USER_IDS
+        or not all(isinstance(user_id, str) for user_id in user_ids)
+    ):
+        return jsonify({
+            'error': 'Bad Request',
+            'message': f'userIds must be a list of at most {_MAX_BULK_USER_IDS} user IDs'
+        }), 400
+    
+    try:
+        db = get_db()
+        
+        # One IN (...) query for every requested profile
+        rows = db.execute(
+            _BULK_PROFILE_STMT, {'user_ids': list(dict.fromkeys(user_ids))}
+        ) if user_ids else ()
+        
+        body = orjson.dumps({row.userId: row._asdict() for row in rows}) + b'\n'
+        return current_app.response_class(body, mimetype='application/json')
     
     except Exception as e:
         return jsonify({
@@ -0,0 +1,57 @@
+"""
+In-process caches for external API search results and list totals.
+
+Repeated searches with the same query and filters are answered from
+memory, skipping both the third-party HTTP call and the database writes
+that follow it. List endpoints reuse recent COUNT(*) results the same way.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Callable, Hashable
+
+from cachetools import TTLCache
+
+SEARCH_CACHE_TTL: int = int(os.getenv("SEARCH_CACHE_TTL", "600"))  # seconds
+COUNT_CACHE_TTL: int = int(os.getenv("COUNT_CACHE_TTL", "30"))  # seconds
+
+_search_cache: TTLCache = TTLCache(maxsize=1024, ttl=SEARCH_CACHE_TTL)
+_search_cache_lock = threading.Lock()
+
+_count_cache: TTLCache = TTLCache(maxsize=1024, ttl=COUNT_CACHE_TTL)
+_count_cache_lock = threading.Lock()
+
+
+def cached_search(
+    prefix: str,
+    params: tuple[Hashable, ...],
+    loader: Callable[[], Any],
+) -> tuple[Any, bool]:
+    """
+    Return (result, from_cache) for a search, calling loader() on a miss.
+
+    Failed loads raise and are not cached.
+    """
+    key = (prefix, params)
+    with _search_cache_lock:
+        result = _search_cache.get(key)
+    if result is not None:
+        return result, True
+
+    result = loader()
+    with _search_cache_lock:
+        _search_cache[key] = result
+    return result, False
+
+
+def cached_count(key: Hashable, loader: Callable[[], int]) -> int:
+    """Return a row count for key, calling loader() on a miss."""
+    with _count_cache_lock:
+        count = _count_cache.get(key)
+    if count is None:
+        count = loader()
+        with _count_cache_lock:
+            _count_cache[key] = count
+    return count
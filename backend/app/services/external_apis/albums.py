@@ -16,27 +16,31 @@ from .base import fetch_json
 from .config import DEEZER_BASE_URL
 
 
-def _normalize_album(raw: dict[str, Any]) -> dict[str, Any]:
-    """Map a Deezer album object to the VibeCheck Album schema."""
+def _normalize_album(raw: dict[str, Any], duration: int | None = None) -> dict[str, Any]:
+    """
+    Map a Deezer album object to the VibeCheck Album schema.
+
+    duration, when given, replaces the top-level duration field.
+    """
     artist = raw.get("artist", {})
     return {
         "id": str(raw.get("id", "")),
         "title": raw.get("title", ""),
         "artist": artist.get("name", "") if isinstance(artist, dict) else str(artist),
         "cover": raw.get("cover_big") or raw.get("cover_medium") or raw.get("cover"),
-        "duration": raw.get("duration"),  # Deezer returns duration in seconds
+        # Deezer returns duration in seconds
+        "duration": duration if duration is not None else raw.get("duration"),
         "url": raw.get("link"),
     }
 
 
 def _normalize_album_detail(raw: dict[str, Any]) -> dict[str, Any]:
     """Map a Deezer album detail response (includes total duration from tracks)."""
-    album = _normalize_album(raw)
+    duration = raw.get("duration")
     # Sum track durations if the top-level duration is missing
-    if not album["duration"] and "tracks" in raw:
-        tracks = raw["tracks"].get("data", [])
-        album["duration"] = sum(t.get("duration", 0) for t in tracks)
-    return album
+    if not duration and "tracks" in raw:
+        duration = sum(t.get("duration", 0) for t in raw["tracks"].get("data", []))
+    return _normalize_album(raw, duration)
 
 
 # ── Public API ────────────────────────────────────────────────────
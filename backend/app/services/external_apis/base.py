@@ -1,25 +1,127 @@
 """
 Shared async HTTP client used by all external API services.
 
-Provides a managed httpx.AsyncClient with timeout, retries,
-and consistent error handling.
+Provides a shared, connection-pooled httpx.AsyncClient with timeout,
+retries, and consistent error handling.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import threading
 import httpx
-from typing import Any
+import orjson
+from typing import Any, Awaitable, TypeVar
+from urllib.parse import quote, urlencode
 
-from .config import REQUEST_TIMEOUT
+from cachetools import TTLCache
+
+from .config import FETCH_CACHE_TTL, REQUEST_TIMEOUT
+
+try:
+    import h2  # noqa: F401  (httpx[http2])
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+T = TypeVar("T")
+
+# One event loop for all external API calls, running on a daemon thread.
+# Sync callers (Flask views) submit coroutines with run_async(). Views stay
+# sync on purpose: Flask's async views run each request on a fresh loop via
+# asgiref, which would throw away pooled connections between requests.
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared background event loop on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever,
+                name="external-api-loop",
+                daemon=True,
+            ).start()
+        return _loop
+
+
+def run_async(coro: Awaitable[T], timeout: float | None = 60.0) -> T:
+    """
+    Run a coroutine on the shared event loop and wait for its result.
+
+    Raises:
+        TimeoutError: if the coroutine does not finish within timeout seconds.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+# One pooled client, so repeat calls to the same host reuse open TCP/TLS
+# connections instead of handshaking every time. An httpx client belongs
+# to the loop it was created on; normally that is the shared loop above.
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
 
 
 async def get_client() -> httpx.AsyncClient:
-    """Create a new async HTTP client with default settings."""
-    return httpx.AsyncClient(
-        timeout=httpx.Timeout(REQUEST_TIMEOUT),
-        follow_redirects=True,
-        headers={"Accept": "application/json"},
-    )
+    """Return the shared async HTTP client, creating it on first use."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        # HTTP/2 multiplexes concurrent calls to one host over a single
+        # connection. With brotli installed, httpx also asks for br bodies.
+        _client = httpx.AsyncClient(
+            http2=_HTTP2,
+            # Fail fast on hosts that don't accept connections
+            timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=min(5.0, REQUEST_TIMEOUT)),
+            # Idle connections stay open for a minute (httpx's default is
+            # 5s), long enough to be reused between requests
+            limits=httpx.Limits(
+                max_keepalive_connections=100, max_connections=200, keepalive_expiry=60.0
+            ),
+            follow_redirects=True,
+            headers={"Accept": "application/json"},
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@atexit.register
+def _close_client_at_exit() -> None:
+    if _client is not None and _client_loop is _loop and _loop is not None and _loop.is_running():
+        try:
+            run_async(close_client(), timeout=5.0)
+        except Exception:
+            pass  # shutting down anyway
+
+
+# Successful GET responses, so repeated lookups don't spend upstream rate
+# limits (RAWG, Unsplash) or a round trip. Errors are never cached.
+_fetch_cache: TTLCache | None = (
+    TTLCache(maxsize=10_000, ttl=FETCH_CACHE_TTL) if FETCH_CACHE_TTL > 0 else None
+)
+_fetch_cache_lock = threading.Lock()
+
+
+# GETs currently in flight by cache key, so concurrent identical lookups
+# (a popular city searched by many users at once) share one upstream call
+_inflight: dict[tuple[str, tuple], asyncio.Task] = {}
 
 
 async def fetch_json(
@@ -30,14 +132,54 @@ async def fetch_json(
     """
     Perform a GET request and return parsed JSON.
 
+    Results are cached for FETCH_CACHE_TTL seconds and shared between
+    callers, so treat them as read-only. Concurrent calls for the same
+    URL and headers wait on a single request.
+
     Raises:
         httpx.HTTPStatusError: on 4xx / 5xx responses.
         httpx.RequestError: on network / timeout errors.
     """
-    async with await get_client() as client:
-        response = await client.get(url, params=params, headers=headers or {})
-        response.raise_for_status()
-        return response.json()
+    # Encode the query string once; the full URL is both the cache key and
+    # what httpx sends, so it doesn't merge and re-encode params itself
+    if params:
+        url = f"{url}?{urlencode(params, quote_via=quote)}"
+
+    key = (url, tuple(headers.items()) if headers else ())
+    if _fetch_cache is not None:
+        with _fetch_cache_lock:
+            cached = _fetch_cache.get(key)
+        if cached is not None:
+            return cached
+
+    loop = asyncio.get_running_loop()
+    task = _inflight.get(key)
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(_fetch_json(key))
+        _inflight[key] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if _inflight.get(key) is done:
+                del _inflight[key]
+
+        task.add_done_callback(_forget)
+    # Shielded so one caller giving up doesn't cancel the others' request
+    return await asyncio.shield(task)
+
+
+async def _fetch_json(key: tuple[str, tuple]) -> Any:
+    """GET key's URL with its headers, caching the parsed JSON on success."""
+    url, headers = key
+    client = await get_client()
+    response = await client.get(url, headers=dict(headers) if headers else None)
+    response.raise_for_status()
+    # orjson decodes the raw bytes in C; response.json() goes through text + stdlib json
+    result = orjson.loads(response.content)
+
+    if _fetch_cache is not None:
+        with _fetch_cache_lock:
+            _fetch_cache[key] = result
+    return result
 
 
 async def post_json(
@@ -57,16 +199,16 @@ async def post_json(
         headers: Extra headers merged with defaults.
         params: Query-string parameters.
     """
-    async with await get_client() as client:
-        kwargs: dict[str, Any] = {}
-        if params:
-            kwargs["params"] = params
-        if headers:
-            kwargs["headers"] = headers
-        if body is not None:
-            kwargs["content"] = body
-        elif data is not None:
-            kwargs["data"] = data
-        response = await client.post(url, **kwargs)
-        response.raise_for_status()
-        return response.json()
+    client = await get_client()
+    kwargs: dict[str, Any] = {}
+    if params:
+        kwargs["params"] = params
+    if headers:
+        kwargs["headers"] = headers
+    if body is not None:
+        kwargs["content"] = body
+    elif data is not None:
+        kwargs["data"] = data
+    response = await client.post(url, **kwargs)
+    response.raise_for_status()
+    return orjson.loads(response.content)
@@ -10,27 +10,28 @@ Returns data shaped to the VibeCheck Book schema:
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
+from cachetools import LRUCache
+
 from .base import fetch_json
 from .config import OPENLIBRARY_BASE_URL
 
+_COVER_URL = "https://covers.openlibrary.org/b/id/{}-L.jpg"
+
 
 def _normalize_book_from_search(raw: dict[str, Any]) -> dict[str, Any]:
     """Map an Open Library search result to the VibeCheck Book schema."""
     key = raw.get("key", "")  # e.g. "/works/OL45883W"
-    ol_id = key.replace("/works/", "")
+    ol_id = key.removeprefix("/works/")
     cover_id = raw.get("cover_i")
 
     return {
         "id": ol_id,
         "title": raw.get("title", ""),
         "author": ", ".join(raw.get("author_name", [])) or "Unknown",
-        "cover": (
-            f"https://covers.openlibrary.org/b/id/{cover_id}-L.jpg"
-            if cover_id
-            else None
-        ),
+        "cover": _COVER_URL.format(cover_id) if cover_id else None,
         "totalPages": raw.get("number_of_pages_median"),
         "url": f"https://openlibrary.org{key}" if key else None,
     }
@@ -45,11 +46,62 @@ async def _resolve_author_name(author_key: str) -> str:
         return "Unknown"
 
 
+async def _resolve_author_names_bulk(author_keys: list[str]) -> dict[str, str]:
+    """
+    Look up many author names in one author-search request.
+
+    Keys the search doesn't return (or a failed request) are simply
+    missing from the result; callers fall back to per-author lookups.
+    """
+    ids = [key.rsplit("/", 1)[-1] for key in author_keys]  # '/authors/OL79034A' -> 'OL79034A'
+    try:
+        raw = await fetch_json(
+            f"{OPENLIBRARY_BASE_URL}/search/authors.json",
+            params={"q": f"key:({' OR '.join(ids)})", "fields": "key,name", "limit": len(ids)},
+        )
+    except Exception:
+        return {}
+    names = {doc.get("key"): doc.get("name") for doc in raw.get("docs", [])}
+    return {key: names[ol_id] for key, ol_id in zip(author_keys, ids) if names.get(ol_id)}
+
+
+# Author name lookups by key, shared across requests. Entries are tasks, so
+# concurrent lookups of the same author wait on one in-flight request.
+_author_name_tasks: LRUCache = LRUCache(maxsize=4096)
+
+
+def _author_name(author_key: str) -> asyncio.Future[str]:
+    """Resolve an author name once; failed lookups are not kept."""
+    task = _author_name_tasks.get(author_key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_resolve_author_name(author_key))
+        _author_name_tasks[author_key] = task
+
+        def _forget_unknown(done: asyncio.Future[str]) -> None:
+            # Cancelled or failed tasks are dropped too, or every later
+            # lookup of this author would await the dead task
+            failed = done.cancelled() or done.exception() is not None
+            if (failed or done.result() == "Unknown") and _author_name_tasks.get(author_key) is done:
+                del _author_name_tasks[author_key]
+
+        task.add_done_callback(_forget_unknown)
+    # Shielded so one caller being cancelled doesn't cancel the shared lookup
+    return asyncio.shield(task)
+
+
+def _remember_author_name(author_key: str, name: str) -> None:
+    """Seed the author name cache with a name fetched some other way."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(name)
+    _author_name_tasks[author_key] = future
+
+
 async def _normalize_book_detail(raw: dict[str, Any], ol_id: str) -> dict[str, Any]:
     """Map an Open Library works response to the VibeCheck Book schema."""
     # Authors in the works endpoint are references — resolve names via API
     authors = raw.get("authors", [])
     author_names: list[str] = []
+    pending: list[tuple[int, str]] = []  # (index in author_names, author key)
     for a in authors:
         author_obj = a.get("author", a)
         if isinstance(author_obj, dict):
@@ -57,15 +109,27 @@ async def _normalize_book_detail(raw: dict[str, Any], ol_id: str) -> dict[str, A
             if not name:
                 key = author_obj.get("key", "")
                 if key:
-                    name = await _resolve_author_name(key)
+                    pending.append((len(author_names), key))
                 else:
                     name = "Unknown"
             author_names.append(name)
 
+    # Fetch the missing names in one search request where possible; the
+    # rest are fetched concurrently rather than one after another
+    if pending:
+        uncached = [
+            key for key in dict.fromkeys(key for _, key in pending)
+            if key not in _author_name_tasks
+        ]
+        if len(uncached) > 1:
+            for key, name in (await _resolve_author_names_bulk(uncached)).items():
+                _remember_author_name(key, name)
+        names = await asyncio.gather(*(_author_name(key) for _, key in pending))
+        for (index, _), name in zip(pending, names):
+            author_names[index] = name
+
     covers = raw.get("covers", [])
-    cover_url = (
-        f"https://covers.openlibrary.org/b/id/{covers[0]}-L.jpg" if covers else None
-    )
+    cover_url = _COVER_URL.format(covers[0]) if covers else None
 
     # Description can be a string or {"type": ..., "value": ...}
     description = raw.get("description", "")
@@ -31,11 +31,14 @@ OPENLIBRARY_BASE_URL: str = "https://openlibrary.org"
 # Completely free, no API key required
 GEOCODING_BASE_URL: str = "https://geocoding-api.open-meteo.com/v1"
 WEATHER_BASE_URL: str = "https://api.open-meteo.com/v1"
+GEOCODE_CACHE_TTL: int = int(os.getenv("GEOCODE_CACHE_TTL", "86400"))  # seconds; 0 disables
 
 # ── Unsplash (Location images) ────────────────────────────
 # Free tier: 50 requests/hour — get a key at https://unsplash.com/developers
 UNSPLASH_ACCESS_KEY: str = os.getenv("UNSPLASH_ACCESS_KEY", "")
 UNSPLASH_BASE_URL: str = "https://api.unsplash.com"
+IMAGE_CACHE_TTL: int = int(os.getenv("IMAGE_CACHE_TTL", "604800"))  # seconds; 0 disables
 
 # ── Shared HTTP settings ─────────────────────────────────────────
 REQUEST_TIMEOUT: float = float(os.getenv("API_TIMEOUT", "15"))  # seconds
+FETCH_CACHE_TTL: int = int(os.getenv("FETCH_CACHE_TTL", "300"))  # seconds; 0 disables
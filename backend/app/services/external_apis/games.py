@@ -16,6 +16,12 @@ from typing import Any
 from .base import fetch_json
 from .config import RAWG_API_KEY, RAWG_BASE_URL
 
+_RAWG_MAX_PAGE_SIZE = 40
+# Most RAWG pages scanned for one difficulty-filtered search
+_MAX_DIFFICULTY_PAGES = 5
+
+_DIFFICULTY_LABELS = ("Easy", "Medium", "Hard")
+
 
 def _normalize_game(raw: dict[str, Any]) -> dict[str, Any]:
     """Map a RAWG game object to the VibeCheck Game schema."""
@@ -48,11 +54,8 @@ def _estimate_difficulty(raw: dict[str, Any]) -> str | None:
     playtime = raw.get("playtime")  # average playtime in hours
     if not playtime:
         return None
-    if playtime < 10:
-        return "Easy"
-    if playtime <= 30:
-        return "Medium"
-    return "Hard"
+    # Index by how many thresholds are passed: 0 → Easy, 1 → Medium, 2 → Hard
+    return _DIFFICULTY_LABELS[(playtime >= 10) + (playtime > 30)]
 
 
 # ── Public API ────────────────────────────────────────────────────
@@ -70,7 +73,8 @@ async def search_games(
     Search games by title, optionally filtered by platform or difficulty.
 
     Note: Difficulty filtering is done client-side since RAWG has no
-    difficulty param. We fetch extra results and filter down.
+    difficulty param. Result pages are fetched one at a time until enough
+    games match (at most _MAX_DIFFICULTY_PAGES requests).
 
     Returns:
         {
@@ -83,29 +87,46 @@ async def search_games(
     if not RAWG_API_KEY:
         raise RuntimeError("RAWG_API_KEY environment variable is not set")
 
-    page = (offset // limit) + 1
-
     params: dict[str, Any] = {
         "key": RAWG_API_KEY,
         "search": query,
-        "page_size": limit if not difficulty else limit * 2,  # over-fetch for filtering
-        "page": page,
     }
     if platform:
         params["search"] = f"{query} {platform}"
 
-    raw = await fetch_json(f"{RAWG_BASE_URL}/games", params=params)
-
-    games = [_normalize_game(g) for g in raw.get("results", [])]
+    if not difficulty:
+        params["page_size"] = limit
+        params["page"] = (offset // limit) + 1
+        raw = await fetch_json(f"{RAWG_BASE_URL}/games", params=params)
+        games = [_normalize_game(g) for g in raw.get("results", [])]
+        return {
+            "data": games,
+            "total": raw.get("count", len(games)),
+            "limit": limit,
+            "offset": offset,
+        }
 
-    # Client-side difficulty filter
-    if difficulty:
-        games = [g for g in games if g.get("difficulty") == difficulty]
-        games = games[:limit]
+    # Quota is per request, so scan in the largest pages RAWG allows and
+    # stop as soon as offset + limit games match. Pages go through
+    # fetch_json's cache, so other difficulties re-filter them for free.
+    params["page_size"] = _RAWG_MAX_PAGE_SIZE
+    matches: list[dict[str, Any]] = []
+    raw: dict[str, Any] = {}
+    for page in range(1, _MAX_DIFFICULTY_PAGES + 1):
+        raw = await fetch_json(f"{RAWG_BASE_URL}/games", params={**params, "page": page})
+        matches.extend(
+            game for game in map(_normalize_game, raw.get("results", []))
+            if game["difficulty"] == difficulty
+        )
+        if len(matches) >= offset + limit or not raw.get("next"):
+            break
 
+    exhausted = not raw.get("next")
     return {
-        "data": games,
-        "total": raw.get("count", len(games)),
+        "data": matches[offset : offset + limit],
+        # Exact once every result was scanned; otherwise RAWG's unfiltered
+        # count is the best upper bound available
+        "total": len(matches) if exhausted else raw.get("count", len(matches)),
         "limit": limit,
         "offset": offset,
     }
@@ -15,12 +15,50 @@ from __future__ import annotations
 
 import asyncio
 import re
+import threading
 from typing import Any
 
 import httpx
+from cachetools import TTLCache
 
 from .base import fetch_json
-from .config import GEOCODING_BASE_URL, UNSPLASH_ACCESS_KEY, UNSPLASH_BASE_URL, WEATHER_BASE_URL
+from .config import (
+    GEOCODE_CACHE_TTL,
+    GEOCODING_BASE_URL,
+    IMAGE_CACHE_TTL,
+    UNSPLASH_ACCESS_KEY,
+    UNSPLASH_BASE_URL,
+    WEATHER_BASE_URL,
+)
+
+# Geocoding results barely change, so they outlive fetch_json's short
+# cache. Keyed on the lowercased name and count; the country filter and
+# offset are applied locally, so they share one entry.
+_geocode_cache: TTLCache | None = (
+    TTLCache(maxsize=4096, ttl=GEOCODE_CACHE_TTL) if GEOCODE_CACHE_TTL > 0 else None
+)
+_geocode_cache_lock = threading.Lock()
+
+
+async def _geocode(query: str, count: int) -> list[dict[str, Any]]:
+    """Return Open-Meteo geocoding results for a place name."""
+    key = (query.strip().lower(), count)
+    if _geocode_cache is not None:
+        with _geocode_cache_lock:
+            cached = _geocode_cache.get(key)
+        if cached is not None:
+            return cached
+
+    raw = await fetch_json(
+        f"{GEOCODING_BASE_URL}/search",
+        params={"name": query, "count": count, "language": "en", "format": "json"},
+    )
+    results = raw.get("results", [])
+
+    if _geocode_cache is not None:
+        with _geocode_cache_lock:
+            _geocode_cache[key] = results
+    return results
 
 
 def _normalize_location(raw: dict[str, Any]) -> dict[str, Any]:
@@ -50,27 +88,55 @@ def _normalize_location(raw: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+# Unsplash photo URLs per (name, country). The best photo of a city is
+# stable for weeks and the free tier allows 50 requests/hour, so hits are
+# kept for IMAGE_CACHE_TTL; names with no photo are retried after an hour.
+_image_cache: TTLCache = TTLCache(maxsize=4096, ttl=max(IMAGE_CACHE_TTL, 1))
+_no_image_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+_image_cache_lock = threading.Lock()
+
+
 async def _get_location_image(name: str, country: str | None = None) -> str | None:
     """Return a location photo URL from Unsplash search API."""
     if not UNSPLASH_ACCESS_KEY:
         return None
+    key = (name.strip().lower(), (country or "").strip().lower())
+    if IMAGE_CACHE_TTL > 0:
+        with _image_cache_lock:
+            cached = _image_cache.get(key)
+            if cached is not None or key in _no_image_cache:
+                return cached
+
     try:
-        # Include country in search query to differentiate between locations with same name
-        query = f"{name}, {country}" if country else name
-        data = await fetch_json(
-            f"{UNSPLASH_BASE_URL}/search/photos",
-            params={
-                "query": f"{query} city landscape",
-                "per_page": 1,
-                "orientation": "landscape",
-            },
-            headers={"Authorization": f"Client-ID {UNSPLASH_ACCESS_KEY}"},
-        )
-        results = data.get("results", [])
-        if results:
-            return results[0].get("urls", {}).get("regular")
+        image_url = await _search_location_image(name, country)
     except Exception:
-        pass
+        return None  # failures aren't cached, so the next call retries
+
+    if IMAGE_CACHE_TTL > 0:
+        with _image_cache_lock:
+            if image_url is None:
+                _no_image_cache[key] = True
+            else:
+                _image_cache[key] = image_url
+    return image_url
+
+
+async def _search_location_image(name: str, country: str | None) -> str | None:
+    """Search Unsplash for a location photo URL; None if there is none."""
+    # Include country in search query to differentiate between locations with same name
+    query = f"{name}, {country}" if country else name
+    data = await fetch_json(
+        f"{UNSPLASH_BASE_URL}/search/photos",
+        params={
+            "query": f"{query} city landscape",
+            "per_page": 1,
+            "orientation": "landscape",
+        },
+        headers={"Authorization": f"Client-ID {UNSPLASH_ACCESS_KEY}"},
+    )
+    results = data.get("results", [])
+    if results:
+        return results[0].get("urls", {}).get("regular")
     return None
 
 
@@ -85,11 +151,13 @@ async def _enrich_with_weather(location: dict[str, Any]) -> dict[str, Any]:
             if lat is None or lon is None:
                 return None
             try:
+                # Rounded to ~1 km so nearby results share fetch_json's
+                # cached forecast; current weather doesn't differ at that scale
                 return await fetch_json(
                     f"{WEATHER_BASE_URL}/forecast",
                     params={
-                        "latitude": lat,
-                        "longitude": lon,
+                        "latitude": round(lat, 2),
+                        "longitude": round(lon, 2),
                         "current_weather": "true",
                         "timezone": "auto",
                     },
@@ -120,37 +188,40 @@ async def _enrich_with_weather(location: dict[str, Any]) -> dict[str, Any]:
     return location
 
 
+# WMO weather interpretation codes used by Open-Meteo
+_WMO_DESCRIPTIONS: dict[int, str] = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Fog",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    71: "Slight snow fall",
+    73: "Moderate snow fall",
+    75: "Heavy snow fall",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail",
+}
+# Codes are 0-99, so a lookup is a plain tuple index rather than a hash probe
+_WMO_TABLE: tuple[str, ...] = tuple(_WMO_DESCRIPTIONS.get(i, "Unknown") for i in range(100))
+
+
 def _wmo_to_description(code: int | None) -> str:
     """Convert WMO weather interpretation code to a human-readable string."""
-    if code is None:
-        return "Unknown"
-    mapping = {
-        0: "Clear sky",
-        1: "Mainly clear",
-        2: "Partly cloudy",
-        3: "Overcast",
-        45: "Fog",
-        48: "Depositing rime fog",
-        51: "Light drizzle",
-        53: "Moderate drizzle",
-        55: "Dense drizzle",
-        61: "Slight rain",
-        63: "Moderate rain",
-        65: "Heavy rain",
-        71: "Slight snow fall",
-        73: "Moderate snow fall",
-        75: "Heavy snow fall",
-        77: "Snow grains",
-        80: "Slight rain showers",
-        81: "Moderate rain showers",
-        82: "Violent rain showers",
-        85: "Slight snow showers",
-        86: "Heavy snow showers",
-        95: "Thunderstorm",
-        96: "Thunderstorm with slight hail",
-        99: "Thunderstorm with heavy hail",
-    }
-    return mapping.get(code, "Unknown")
+    return _WMO_TABLE[code] if isinstance(code, int) and 0 <= code < 100 else "Unknown"
 
 
 # ── Public API ────────────────────────────────────────────────────
@@ -176,37 +247,35 @@ async def search_locations(
             "offset": int,
         }
     """
-    params: dict[str, Any] = {
-        "name": query,
-        "count": min(limit, 100),  # API max is 100
-        "language": "en",
-        "format": "json",
-    }
-
-    raw = await fetch_json(f"{GEOCODING_BASE_URL}/search", params=params)
-
-    results = raw.get("results", [])
-
-    # Country filter (Open-Meteo doesn't have a country parameter)
-    if country:
-        country_lower = country.lower()
-        results = [
-            r
-            for r in results
-            if country_lower in (r.get("country", "").lower())
-            or country_lower in (r.get("country_code", "").lower())
-        ]
-
-    # Apply offset (API doesn't support pagination natively)
-    total = len(results)
-    results = results[offset : offset + limit]
-
-    locations = [_normalize_location(r) for r in results]
-
-    # Enrich each location with live weather
-    enriched = []
-    for loc in locations:
-        enriched.append(await _enrich_with_weather(loc))
+    results = await _geocode(query, min(limit, 100))  # API max is 100
+
+    # Country filter (Open-Meteo doesn't have a country parameter) and
+    # offset (API doesn't support pagination natively) in one pass: every
+    # match is counted for total, but only the requested page is normalized
+    country_lower = country.lower() if country else None
+    end = offset + limit
+    locations = []
+    total = 0
+    for r in results:
+        if country_lower and not (
+            country_lower in r.get("country", "").lower()
+            or country_lower in r.get("country_code", "").lower()
+        ):
+            continue
+        if offset <= total < end:
+            locations.append(_normalize_location(r))
+        total += 1
+
+    # Enrich all locations concurrently so their weather/photo round trips
+    # overlap (gather keeps result order). A failed enrichment keeps the
+    # plain location rather than failing the whole page.
+    results = await asyncio.gather(
+        *(_enrich_with_weather(loc) for loc in locations), return_exceptions=True
+    )
+    enriched = [
+        loc if isinstance(result, BaseException) else result
+        for loc, result in zip(locations, results)
+    ]
 
     return {
         "data": enriched,
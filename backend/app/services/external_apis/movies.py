@@ -17,35 +17,30 @@ from .base import fetch_json
 from .config import TMDB_API_KEY, TMDB_BASE_URL, TMDB_IMAGE_BASE
 
 
+# Per media type: TMDB's title field, date field, and our page URL prefix
+_MOVIE_FIELDS = ("title", "release_date", "https://www.themoviedb.org/movie/")
+_TV_FIELDS = ("name", "first_air_date", "https://www.themoviedb.org/tv/")
+
+
 def _normalize_movie(raw: dict[str, Any], *, media_type: str = "movie") -> dict[str, Any]:
     """Map a TMDB result to the VibeCheck Movie schema."""
     tmdb_id = raw.get("id", "")
     is_tv = media_type == "tv" or "first_air_date" in raw
-
-    title = raw.get("title") or raw.get("name", "")
-    date_str = raw.get("release_date") or raw.get("first_air_date", "")
-    year = _parse_year(date_str)
+    title_key, date_key, url_prefix = _TV_FIELDS if is_tv else _MOVIE_FIELDS
 
     poster_path = raw.get("poster_path")
-    poster = f"{TMDB_IMAGE_BASE}{poster_path}" if poster_path else None
-
-    # Director is only available in detail responses (credits)
-    director = raw.get("_director", "N/A")
 
     return {
         "id": str(tmdb_id),
-        "title": title,
-        "year": year,
-        "director": director,
-        "poster": poster,
+        "title": raw.get(title_key) or "",
+        "year": _parse_year(raw.get(date_key)),
+        # Director is only available in detail responses (credits)
+        "director": raw.get("_director", "N/A"),
+        "poster": f"{TMDB_IMAGE_BASE}{poster_path}" if poster_path else None,
         "season": raw.get("number_of_seasons"),
         "episode": raw.get("number_of_episodes"),
         "type": "tv" if is_tv else "movie",
-        "url": (
-            f"https://www.themoviedb.org/{'tv' if is_tv else 'movie'}/{tmdb_id}"
-            if tmdb_id
-            else None
-        ),
+        "url": f"{url_prefix}{tmdb_id}" if tmdb_id else None,
     }
 
 
@@ -169,6 +164,5 @@ async def get_movie_by_id(
         (p.get("name", "N/A") for p in crew if p.get("job") == "Director"),
         "N/A",
     )
-    raw["_director"] = director
-
-    return _normalize_movie(raw, media_type=media_type)
+    # raw may be a cached response shared with other callers; don't mutate it
+    return _normalize_movie({**raw, "_director": director}, media_type=media_type)
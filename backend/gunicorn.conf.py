@@ -0,0 +1,26 @@
+"""Gunicorn settings for serving the API in production (see Dockerfile)"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '3000')}"
+
+# Threaded workers: views are sync and mostly wait on Postgres, the
+# external APIs or bcrypt, all of which release the GIL. (gevent would
+# need psycopg2 patched to yield, and clashes with the asyncio thread
+# the external API services run on.)
+worker_class = 'gthread'
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# A request holds at most one connection, so a pool of one per thread is
+# enough. The app's default (20 + 10 overflow) would otherwise be opened
+# by every worker and can exceed Postgres' max_connections (100).
+# Workers import the app after this runs, so they inherit these defaults;
+# explicit settings still win.
+os.environ.setdefault('DB_POOL_SIZE', str(threads))
+os.environ.setdefault('DB_MAX_OVERFLOW', '0')
+
+timeout = 60
+keepalive = 5
+accesslog = '-'
@@ -0,0 +1,52 @@
+"""
+Shared pytest fixtures for the VibeCheck API tests
+"""
+
+import pytest
+
+from test_api import CONTENT_TESTS, VibeCheckAPITester
+
+
+# Tests share state through the session's tester: a detail test reuses the
+# ID its list test found, and most other tests need the registered user's
+# token. Under `pytest -n auto --dist=loadgroup` each group stays on one
+# worker, in file order, while different groups run in parallel.
+_CONTENT_GROUPS = ('movie', 'album', 'game', 'book', 'location', 'search')
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        group = next((g for g in _CONTENT_GROUPS if g in item.name), 'session')
+        item.add_marker(pytest.mark.xdist_group(group))
+
+
+def pytest_generate_tests(metafunc):
+    ids = [category for category, *_ in CONTENT_TESTS]
+    if metafunc.function.__name__ == "test_content_list_and_detail":
+        metafunc.parametrize(
+            "list_test,detail_test",
+            [(list_test, detail_test) for _, list_test, detail_test, _ in CONTENT_TESTS],
+            ids=ids,
+        )
+    elif metafunc.function.__name__ == "test_content_query":
+        metafunc.parametrize(
+            "query_test", [query_test for *_, query_test in CONTENT_TESTS], ids=ids
+        )
+
+
+@pytest.fixture(scope="session")
+def tester():
+    """Create a single VibeCheckAPITester instance for all tests (one per worker)"""
+    # Results come from pytest's reporter, so skip the tester's own log
+    # (its prints would interleave across xdist workers anyway)
+    tester = VibeCheckAPITester(report=False)
+    yield tester
+    tester.close()
+
+
+@pytest.fixture(scope="session")
+def registered_user(tester):
+    """Register one test user per session (per worker) and reuse its token"""
+    if not tester.ensure_registered():
+        pytest.fail("Could not register a test user")
+    return tester.credentials
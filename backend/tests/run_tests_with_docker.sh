@@ -84,10 +84,10 @@ else
     echo -e "${YELLOW}⚠️  Using system Python (no venv found)${NC}"
 fi
 
-# Check if requests module is available, if not install dependencies
-if ! $PYTHON_CMD -c "import requests" 2>/dev/null; then
+# Check if httpx module is available, if not install dependencies
+if ! $PYTHON_CMD -c "import httpx" 2>/dev/null; then
     echo -e "${YELLOW}⚠️  Test dependencies not found. Installing...${NC}"
-    $PYTHON_CMD -m pip install pytest requests pytest-html pytest-json-report --quiet
+    $PYTHON_CMD -m pip install pytest httpx orjson pytest-html pytest-json-report --quiet
     echo -e "${GREEN}✓ Dependencies installed${NC}"
 fi
 
@@ -4,55 +4,61 @@ Quick API Test Runner
 Runs essential smoke tests to verify API is working
 """
 
-import requests
+import asyncio
+import httpx
 import sys
 
 BASE_URL = "http://localhost:3000/api/v1"
 
-def check(endpoint, method="GET", **kwargs):
-    """Quick check helper"""
-    url = f"{BASE_URL}{endpoint}"
-    r = None
+async def check(client, endpoint, method="GET", json=None):
+    """Quick check helper, returns (report line, passed)"""
     try:
-        if method == "GET":
-            r = requests.get(url, **kwargs)
-        elif method == "POST":
-            r = requests.post(url, **kwargs)
-        
-        if r:
-            status = "✓" if r.status_code < 400 else "✗"
-            print(f"{status} [{r.status_code}] {method} {endpoint}")
-            return r.status_code < 400
-        return False
+        r = await client.request(method, endpoint, json=json)
     except Exception as e:
-        print(f"✗ [ERR] {method} {endpoint} - {str(e)[:50]}")
-        return False
+        return f"✗ [ERR] {method} {endpoint} - {str(e)[:50]}", False
+    
+    status = "✓" if r.status_code < 400 else "✗"
+    return f"{status} [{r.status_code}] {method} {endpoint}", r.status_code < 400
+
+async def run_checks():
+    """Run every check concurrently over one pooled client, in report order"""
+    sections = [
+        # (heading, checks, counted in the summary)
+        ("🏥 Health Check", [("/health",)], True),
+        # Content endpoints (should work without auth)
+        ("📚 Content Endpoints", [
+            ("/content/movies?limit=1",),
+            ("/content/albums?limit=1",),
+            ("/content/games?limit=1",),
+            ("/content/books?limit=1",),
+            ("/content/locations?limit=1",),
+        ], True),
+        ("🔍 Search", [("/search?query=test&limit=1",)], True),
+        ("🔐 Auth (expect 400/401 without valid data)", [
+            ("/auth/login", "POST", {"email": "test@test.com", "password": "wrong"}),
+        ], False),
+    ]
+    
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=10.0) as client:
+        outcomes = await asyncio.gather(*[
+            asyncio.gather(*[check(client, *args) for args in checks])
+            for _, checks, _ in sections
+        ])
+    
+    results = []
+    for (heading, _, counted), section in zip(sections, outcomes):
+        print(f"\n{heading}")
+        for line, passed in section:
+            print(line)
+            if counted:
+                results.append(passed)
+    return results
 
 def main():
     print("🔍 VibeCheck API Smoke Test")
     print("=" * 50)
     
-    results = []
-    
-    # Health check
-    print("\n🏥 Health Check")
-    results.append(check("/health"))
-    
-    # Content endpoints (should work without auth)
-    print("\n📚 Content Endpoints")
-    results.append(check("/content/movies?limit=1"))
-    results.append(check("/content/albums?limit=1"))
-    results.append(check("/content/games?limit=1"))
-    results.append(check("/content/books?limit=1"))
-    results.append(check("/content/locations?limit=1"))
-    
-    # Search
-    print("\n🔍 Search")
-    results.append(check("/search?query=test&limit=1"))
-    
-    # Auth endpoints
-    print("\n🔐 Auth (expect 400/401 without valid data)")
-    check("/auth/login", "POST", json={"email": "test@test.com", "password": "wrong"})
+    results = asyncio.run(run_checks())
     
     # Summary
     print("\n" + "=" * 50)